@@ -2,10 +2,28 @@
 Clock display functionality for Pixoomat
 """
 import datetime
-import math
+import time
+from functools import lru_cache
 from typing import Optional, Tuple
 
 
+@lru_cache(maxsize=128)
+def _format_hm(hour: int, minute: int, time_format: str) -> str:
+    """Format hour/minute; strftime re-parses its format string every call"""
+    if time_format == "12":
+        ampm = "AM" if hour < 12 else "PM"
+        return f"{hour % 12 or 12:02}:{minute:02} {ampm}"
+    return f"{hour:02}:{minute:02}"  # 24-hour format
+
+
+@lru_cache(maxsize=64)
+def _layout(text_len: int, font_width: int, font_height: int, center_x: int, center_y: int) -> Tuple[int, int]:
+    """Top-left position that centers text of the given length on screen"""
+    # Estimate text width based on character count and font
+    text_width = text_len * font_width
+    return max(0, center_x - text_width // 2), max(0, center_y - font_height // 2)
+
+
 class ClockDisplay:
     """Handles time formatting and display rendering for Pixoo device"""
 
@@ -13,31 +31,27 @@ class ClockDisplay:
         self.screen_size = screen_size
         self.center_x = screen_size // 2
         self.center_y = screen_size // 2
+        # The date string only changes once per day
+        self._date_key: Optional[int] = None
+        self._date_str = ""
 
-    def format_time(self, time_format: str = "24") -> str:
-        """Format current time according to specified format"""
-        now = datetime.datetime.now()
+    def snapshot(self) -> datetime.datetime:
+        """Capture the current time once so a refresh tick renders consistently"""
+        return datetime.datetime.now()
 
-        if time_format == "12":
-            return now.strftime("%I:%M %p")
-        else:  # 24-hour format
-            return now.strftime("%H:%M")
+    def format_time(self, time_format: str = "24", now: Optional[datetime.datetime] = None) -> str:
+        """Format given (or current) time according to specified format"""
+        if now is None:
+            now = self.snapshot()
+        return _format_hm(now.hour, now.minute, time_format)
 
     def calculate_text_position(self, text: str, font_width: int = 4, font_height: int = 6) -> Tuple[int, int]:
         """Calculate centered position for text on screen"""
-        # Estimate text width based on character count and font
-        text_width = len(text) * font_width
-        text_height = font_height
-
-        # Calculate centered position
-        x = max(0, self.center_x - text_width // 2)
-        y = max(0, self.center_y - text_height // 2)
-
-        return x, y
+        return _layout(len(text), font_width, font_height, self.center_x, self.center_y)
 
-    def get_time_display_data(self, time_format: str = "24") -> dict:
+    def get_time_display_data(self, time_format: str = "24", now: Optional[datetime.datetime] = None) -> dict:
         """Get formatted time and position data for display"""
-        time_str = self.format_time(time_format)
+        time_str = self.format_time(time_format, now)
         x, y = self.calculate_text_position(time_str)
 
         return {
@@ -47,10 +61,15 @@ class ClockDisplay:
             'format': time_format
         }
 
-    def get_date_display_data(self) -> dict:
+    def get_date_display_data(self, now: Optional[datetime.datetime] = None) -> dict:
         """Get current date for optional display"""
-        now = datetime.datetime.now()
-        date_str = now.strftime("%m/%d")
+        if now is None:
+            now = self.snapshot()
+        day = now.toordinal()
+        if day != self._date_key:
+            self._date_str = f"{now.month:02}/{now.day:02}"
+            self._date_key = day
+        date_str = self._date_str
         x, y = self.calculate_text_position(date_str)
 
         return {
@@ -79,9 +98,10 @@ class ClockDisplay:
             'code': weather_data.get('weathercode', 0)
         }
 
-    def get_seconds_indicator(self) -> dict:
+    def get_seconds_indicator(self, now: Optional[datetime.datetime] = None) -> dict:
         """Get visual seconds indicator (optional feature)"""
-        now = datetime.datetime.now()
+        if now is None:
+            now = self.snapshot()
         seconds = now.second
 
         # Create a simple progress bar for seconds
@@ -96,7 +116,6 @@ class ClockDisplay:
             'height': 2
         }
 
-    def should_update_display(self, last_update: datetime.datetime, interval: int) -> bool:
-        """Check if display should be updated based on interval"""
-        now = datetime.datetime.now()
-        return (now - last_update).total_seconds() >= interval
\ No newline at end of file
+    def should_update_display(self, last_update: float, interval: int) -> bool:
+        """Check if display should be updated based on a time.monotonic() timestamp"""
+        return time.monotonic() - last_update >= interval
@@ -1,15 +1,51 @@
 """
 Configuration management for Pixoomat
 """
+import copy
 import json
 import os
 import argparse
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import asdict, dataclass, field, fields
+from typing import ClassVar, Dict, Optional, Tuple
 import datetime
 
 from layout_manager import LayoutManager
 
+VALID_TIME_FORMATS = frozenset({'12', '24'})
+VALID_SCREEN_SIZES = frozenset({16, 32, 64})
+
+# Command line argument name -> PixoomatConfig attribute
+_ARG_MAP = (
+    ('ip', 'ip_address'),
+    ('port', 'port'),
+    ('screen_size', 'screen_size'),
+    ('brightness', 'brightness'),
+    ('format', 'time_format'),
+    ('interval', 'update_interval'),
+    ('debug', 'debug'),
+    ('discover', 'auto_discover'),
+    ('use_gui', 'use_gui'),
+    ('layout_config', 'layout_config'),
+)
+
+
+def _env_bool(value: str) -> bool:
+    """Parse a 'true'/'false' environment variable"""
+    return value.lower() == 'true'
+
+
+# Environment variable -> (PixoomatConfig attribute, parser)
+_ENV_MAP = (
+    ('PIXOO_IP', 'ip_address', str),
+    ('PIXOO_PORT', 'port', int),
+    ('PIXOO_SCREEN_SIZE', 'screen_size', int),
+    ('PIXOO_BRIGHTNESS', 'brightness', int),
+    ('PIXOO_TIME_FORMAT', 'time_format', str),
+    ('PIXOO_UPDATE_INTERVAL', 'update_interval', int),
+    ('PIXOO_DEBUG', 'debug', _env_bool),
+    ('PIXOO_SHOW_WEATHER', 'show_weather', _env_bool),
+)
+
 
 @dataclass
 class PixoomatConfig:
@@ -41,36 +77,23 @@ class PixoomatConfig:
     connection_retries: int = 5
     refresh_connection: bool = True
 
+    # Parsed config files keyed by absolute path -> (st_mtime_ns, config)
+    _file_cache: ClassVar[Dict[str, Tuple[int, 'PixoomatConfig']]] = {}
+
     @classmethod
     def from_args(cls, args: argparse.Namespace) -> 'PixoomatConfig':
         """Create config from command line arguments"""
         config = cls()
 
-        if args.ip:
-            config.ip_address = args.ip
-        if args.port:
-            config.port = args.port
-        if args.screen_size:
-            config.screen_size = args.screen_size
-        if args.brightness:
-            config.brightness = args.brightness
-        if args.format:
-            config.time_format = args.format
-        if args.interval:
-            config.update_interval = args.interval
-        if args.debug:
-            config.debug = args.debug
-        if args.no_weather:
+        for arg_name, attr in _ARG_MAP:
+            value = getattr(args, arg_name, None)
+            if value is not None:
+                setattr(config, attr, value)
+        if getattr(args, 'no_weather', False):
             config.show_weather = False
-        if args.discover:
-            config.auto_discover = args.discover
-        if args.use_gui:
-            config.use_gui = args.use_gui
-        if args.layout_config:
-            config.layout_config = args.layout_config
 
         # Parse color if provided
-        if args.color:
+        if getattr(args, 'color', None):
             try:
                 color_values = tuple(map(int, args.color.split(',')))
                 if len(color_values) != 3:
@@ -85,15 +108,26 @@ class PixoomatConfig:
     def from_file(cls, filepath: str) -> 'PixoomatConfig':
         """Load config from JSON file"""
         try:
-            with open(filepath, 'r') as f:
+            path = os.path.abspath(filepath)
+            mtime_ns = os.stat(path).st_mtime_ns
+
+            # Reuse the parsed result until the file changes on disk
+            cached = cls._file_cache.get(path)
+            if cached is not None and cached[0] == mtime_ns:
+                return copy.copy(cached[1])
+
+            with open(path, 'r') as f:
                 data = json.load(f)
 
-            config = cls()
-            for key, value in data.items():
-                if hasattr(config, key):
-                    setattr(config, key, value)
+            # Unknown keys are ignored; JSON stores colors as lists
+            kwargs = {key: data[key] for key in _CONFIG_FIELDS & data.keys()}
+            for key in ('text_color', 'background_color'):
+                if isinstance(kwargs.get(key), list):
+                    kwargs[key] = tuple(kwargs[key])
+            config = cls(**kwargs)
 
-            return config
+            cls._file_cache[path] = (mtime_ns, config)
+            return copy.copy(config)
         except FileNotFoundError:
             raise FileNotFoundError(f"Config file not found: {filepath}")
         except json.JSONDecodeError as e:
@@ -104,61 +138,33 @@ class PixoomatConfig:
         """Load config from environment variables"""
         config = cls()
 
-        config.ip_address = os.getenv('PIXOO_IP')
-
-        port_env = os.getenv('PIXOO_PORT')
-        if port_env:
-            config.port = int(port_env)
-
-        screen_size_env = os.getenv('PIXOO_SCREEN_SIZE')
-        if screen_size_env:
-            config.screen_size = int(screen_size_env)
-
-        brightness_env = os.getenv('PIXOO_BRIGHTNESS')
-        if brightness_env:
-            config.brightness = int(brightness_env)
-
-        time_format_env = os.getenv('PIXOO_TIME_FORMAT')
-        if time_format_env:
-            config.time_format = time_format_env
-
-        update_interval_env = os.getenv('PIXOO_UPDATE_INTERVAL')
-        if update_interval_env:
-            config.update_interval = int(update_interval_env)
-
-        debug_env = os.getenv('PIXOO_DEBUG')
-        if debug_env:
-            config.debug = debug_env.lower() == 'true'
-
-        show_weather_env = os.getenv('PIXOO_SHOW_WEATHER')
-        if show_weather_env:
-            config.show_weather = show_weather_env.lower() == 'true'
+        env = os.environ
+        for env_key, attr, cast in _ENV_MAP:
+            value = env.get(env_key)
+            if value:
+                setattr(config, attr, cast(value))
 
         return config
 
     def to_file(self, filepath: str) -> None:
         """Save config to JSON file"""
-        data = {
-            'ip_address': self.ip_address,
-            'port': self.port,
-            'screen_size': self.screen_size,
-            'brightness': self.brightness,
-            'time_format': self.time_format,
-            'update_interval': self.update_interval,
-            'text_color': list(self.text_color),
-            'background_color': list(self.background_color),
-            'use_gui': self.use_gui,
-            'layout_config': self.layout_config,
-            'show_weather': self.show_weather,
-            'weather_interval': self.weather_interval,
-            'debug': self.debug,
-            'auto_discover': self.auto_discover,
-            'connection_retries': self.connection_retries,
-            'refresh_connection': self.refresh_connection
-        }
-
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        data = asdict(self)
+        data['text_color'] = list(self.text_color)
+        data['background_color'] = list(self.background_color)
+
+        # Write to a temp file and rename so a failed save never truncates
+        # the existing config
+        tmp_filepath = filepath + '.tmp'
+        try:
+            with open(tmp_filepath, 'w') as f:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_filepath, filepath)
+        except Exception:
+            if os.path.exists(tmp_filepath):
+                os.remove(tmp_filepath)
+            raise
 
     def validate(self) -> list[str]:
         """Validate configuration and return list of errors"""
@@ -167,7 +173,7 @@ class PixoomatConfig:
         if not 1 <= self.port <= 65535:
             errors.append("port must be between 1 and 65535")
 
-        if self.time_format not in ['12', '24']:
+        if self.time_format not in VALID_TIME_FORMATS:
             errors.append("time_format must be '12' or '24'")
 
         if not 0 <= self.brightness <= 100:
@@ -176,7 +182,7 @@ class PixoomatConfig:
         if self.update_interval < 1:
             errors.append("update_interval must be at least 1 second")
 
-        if self.screen_size not in [16, 32, 64]:
+        if self.screen_size not in VALID_SCREEN_SIZES:
             errors.append("screen_size must be 16, 32, or 64")
 
         if len(self.text_color) != 3 or any(not 0 <= c <= 255 for c in self.text_color):
@@ -188,6 +194,10 @@ class PixoomatConfig:
         return errors
 
 
+# Names accepted by PixoomatConfig(); excludes class-level attributes
+_CONFIG_FIELDS = frozenset(f.name for f in fields(PixoomatConfig))
+
+
 def create_argument_parser() -> argparse.ArgumentParser:
     """Create command line argument parser"""
     parser = argparse.ArgumentParser(
@@ -1,10 +1,25 @@
 """
 Device discovery functionality for Pixoomat
 """
+import errno
+import selectors
 import socket
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
 from typing import List, Optional
-from zeroconf import ServiceBrowser, ServiceListener, Zeroconf
+
+# Interface name prefixes of containers, bridges, VMs and VPNs
+_VIRTUAL_INTERFACE_PREFIXES = ('docker', 'br-', 'veth', 'virbr', 'vmnet', 'vboxnet',
+                               'tun', 'tap', 'utun', 'wg', 'zt', 'tailscale')
+
+# Local subnet rarely changes; remember it briefly across discovery runs
+PREFIX_CACHE_TTL = 60
+_prefix_cache: Optional[tuple] = None  # (prefix, monotonic timestamp)
+
+# Seconds the device panels reuse a non-empty discovery result before scanning again
+DISCOVERY_CACHE_TTL = 60
 
 
 class PixooDiscovery:
@@ -13,9 +28,19 @@ class PixooDiscovery:
     # Pixoo devices typically use this service name
     SERVICE_TYPE = "_http._tcp.local."
     DEVICE_NAME_PREFIX = "Pixoo"
-
-    def __init__(self, timeout: int = 10, port: int = 80):
+    CONNECT_TIMEOUT = 0.1
+    IDENTIFY_TIMEOUT = 2
+    # Probes kept open at once across all sweeps; stays well under common
+    # open-file limits
+    MAX_IN_FLIGHT = 64
+    # Seconds to wait for the per-interface sweeps in discover()
+    SCAN_TIMEOUT = 5
+    MDNS_GRACE_PERIOD = 0.5
+
+    def __init__(self, timeout: float = 10, port: int = 80, early_exit_count: int = 1):
         self.timeout = timeout
+        # mDNS discovery stops waiting once this many devices have answered
+        self.early_exit_count = early_exit_count
         self.port = port
         self.discovered_devices = []
         self.zeroconf = None
@@ -23,16 +48,58 @@ class PixooDiscovery:
 
     def _get_local_network_prefix(self) -> str:
         """Get the local network prefix (e.g. 192.168.1)"""
+        global _prefix_cache
+
+        now = time.monotonic()
+        if _prefix_cache is not None and now - _prefix_cache[1] < PREFIX_CACHE_TTL:
+            return _prefix_cache[0]
+
         try:
             s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             # Doesn't need to be reachable
             s.connect(('8.8.8.8', 1))
             local_ip = s.getsockname()[0]
             s.close()
-            return '.'.join(local_ip.split('.')[:-1])
+            prefix = '.'.join(local_ip.split('.')[:-1])
         except Exception:
+            # Don't cache the fallback so a later attempt can succeed
             return "192.168.1"
 
+        _prefix_cache = (prefix, now)
+        return prefix
+
+    def _get_local_network_prefixes(self) -> List[str]:
+        """Get the /24 prefix of every active physical IPv4 interface"""
+        prefixes = []
+        try:
+            import psutil
+            stats = psutil.net_if_stats()
+            for name, addrs in psutil.net_if_addrs().items():
+                # Containers, bridges and VPNs won't have a Pixoo behind them
+                if name.startswith(_VIRTUAL_INTERFACE_PREFIXES):
+                    continue
+                if name in stats and not stats[name].isup:
+                    continue
+                for addr in addrs:
+                    # Point-to-point links (most VPNs) have no broadcast address
+                    if addr.family != socket.AF_INET or not addr.broadcast:
+                        continue
+                    # Skip loopback and link-local addresses
+                    if addr.address.startswith(('127.', '169.254.')):
+                        continue
+                    prefix = '.'.join(addr.address.split('.')[:-1])
+                    if prefix not in prefixes:
+                        prefixes.append(prefix)
+        except Exception:
+            pass
+
+        return prefixes or [self._get_local_network_prefix()]
+
+    def discover_on_interface(self, network_prefix: str) -> List[dict]:
+        """Scan a single interface's /24 for Pixoo devices"""
+        ips = self.scan_network_range(network_prefix)
+        return [{'name': f'Pixoo-{ip}', 'ip': ip} for ip in ips]
+
     def scan_network_range(self, network_prefix: Optional[str] = None) -> List[str]:
         """Scan network range for Pixoo devices (fallback method)"""
         if network_prefix is None:
@@ -40,36 +107,107 @@ class PixooDiscovery:
 
         print(f"Scanning network {network_prefix}.0/24...")
         found_ips = []
+        selector = selectors.DefaultSelector()
 
-        for i in range(1, 255):
-            ip = f"{network_prefix}.{i}"
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(0.1)
-
-            try:
-                result = sock.connect_ex((ip, self.port))
-                if result == 0:
-                    # Try to identify if it's a Pixoo device
-                    if self._is_pixoo_device(ip):
-                        found_ips.append(ip)
-                        print(f"Found potential Pixoo device at {ip}")
-            except Exception:
-                pass
-            finally:
-                sock.close()
+        pending = deque(f"{network_prefix}.{i}" for i in range(1, 255))
+
+        def drop(sock):
+            selector.unregister(sock)
+            sock.close()
+            _probe_slots.release()
+
+        def start_probes():
+            """Open connects while probe slots are free and IPs remain"""
+            while pending:
+                # Only block for a slot when this sweep has nothing else to wait on
+                if not _probe_slots.acquire(blocking=not selector.get_map()):
+                    return
+                ip = pending.popleft()
+                try:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                except OSError:
+                    _probe_slots.release()
+                    if selector.get_map():
+                        # Likely out of file descriptors; retry once a probe finishes
+                        pending.appendleft(ip)
+                        return
+                    continue
+                try:
+                    sock.setblocking(False)
+                    result = sock.connect_ex((ip, self.port))
+                except OSError:
+                    result = None
+                if result not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    sock.close()
+                    _probe_slots.release()
+                    continue
+                deadline = time.monotonic() + self.CONNECT_TIMEOUT
+                selector.register(sock, selectors.EVENT_WRITE, (ip, deadline))
+
+        try:
+            # Multiplex a window of connects on this thread, refilling it
+            # as probes finish
+            start_probes()
+            while selector.get_map():
+                wait = min(key.data[1] for key in selector.get_map().values()) - time.monotonic()
+                for key, mask in selector.select(max(0, wait)):
+                    sock = key.fileobj
+                    ip = key.data[0]
+
+                    if mask & selectors.EVENT_WRITE:
+                        if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) != 0:
+                            drop(sock)
+                            continue
+
+                        # Port is open: identify over the same connection
+                        try:
+                            sock.send(f"GET / HTTP/1.0\r\nHost: {ip}\r\n\r\n".encode())
+                        except OSError:
+                            drop(sock)
+                            continue
+                        deadline = time.monotonic() + self.IDENTIFY_TIMEOUT
+                        selector.modify(sock, selectors.EVENT_READ, (ip, deadline))
+                    else:
+                        try:
+                            response = sock.recv(1024).lower()
+                        except OSError:
+                            response = b''
+                        drop(sock)
+
+                        # Check if response contains Pixoo identifiers
+                        if b'pixoo' in response or b'divoom' in response:
+                            found_ips.append(ip)
+                            print(f"Found potential Pixoo device at {ip}")
+
+                now = time.monotonic()
+                for key in list(selector.get_map().values()):
+                    if key.data[1] <= now:
+                        drop(key.fileobj)
+                start_probes()
+        finally:
+            for key in list(selector.get_map().values()):
+                key.fileobj.close()
+                _probe_slots.release()
+            selector.close()
 
         return found_ips
 
     def discover_mdns(self) -> List[dict]:
         """Discover devices using mDNS/Bonjour"""
+        # Imported here so the CLI doesn't pay for zeroconf unless discovering
+        from zeroconf import ServiceBrowser, ServiceListener, Zeroconf
+
         print("Discovering Pixoo devices using mDNS...")
 
         class PixooListener(ServiceListener):
-            def __init__(self):
+            def __init__(self, name_prefix, early_exit_count):
+                self.name_prefix = name_prefix
+                self.early_exit_count = early_exit_count
                 self.devices = []
+                self.found = threading.Event()
 
             def add_service(self, zeroconf, service_type, name):
-                if PixooDiscovery.DEVICE_NAME_PREFIX in name:
+                if self.name_prefix in name:
                     try:
                         info = zeroconf.get_service_info(service_type, name)
                         if info and info.addresses:
@@ -79,6 +217,8 @@ class PixooDiscovery:
                         else:
                             print(f"Found device: {name} (IP unknown)")
                             self.devices.append({'name': name})
+                        if len(self.devices) >= self.early_exit_count:
+                            self.found.set()
                     except Exception as e:
                         print(f"Error resolving service info for {name}: {e}")
 
@@ -88,7 +228,7 @@ class PixooDiscovery:
             def update_service(self, zeroconf, service_type, name):
                 pass
 
-        listener = PixooListener()
+        listener = PixooListener(self.DEVICE_NAME_PREFIX, self.early_exit_count)
 
         try:
             self.zeroconf = Zeroconf()
@@ -98,10 +238,12 @@ class PixooDiscovery:
                 listener
             )
 
-            # Wait for devices to be discovered
-            time.sleep(self.timeout)
+            # Return as soon as enough devices show up, allowing a short
+            # grace period for any others announcing at the same time
+            if listener.found.wait(self.timeout):
+                time.sleep(self.MDNS_GRACE_PERIOD)
 
-            return listener.devices
+            return list(listener.devices)
 
         except Exception as e:
             print(f"mDNS discovery failed: {e}")
@@ -122,32 +264,34 @@ class PixooDiscovery:
         # Fallback to network scan if mDNS fails or finds nothing
         if not devices:
             print("mDNS discovery found no devices, trying network scan...")
-            ips = self.scan_network_range(network_prefix)
-            devices = [{'name': f'Pixoo-{ip}', 'ip': ip} for ip in ips]
+            if network_prefix is not None:
+                devices = self.discover_on_interface(network_prefix)
+            else:
+                # Scan every interface at once so multi-homed machines
+                # don't pay one sweep per NIC; the sweeps share the probe budget
+                prefixes = self._get_local_network_prefixes()
+                by_ip = {}
+                executor = ThreadPoolExecutor(max_workers=len(prefixes))
+                futures = {executor.submit(self.discover_on_interface, prefix): prefix
+                           for prefix in prefixes}
+                try:
+                    for future in as_completed(futures, timeout=self.SCAN_TIMEOUT):
+                        try:
+                            found = future.result()
+                        except Exception as e:
+                            print(f"Network scan of {futures[future]}.0/24 failed: {e}")
+                            continue
+                        for device in found:
+                            by_ip.setdefault(device['ip'], device)
+                except FuturesTimeoutError:
+                    print("Network scan timed out; keeping the devices found so far")
+                finally:
+                    executor.shutdown(wait=False)
+                devices = list(by_ip.values())
 
         self.discovered_devices = devices
         return devices
 
-    def _is_pixoo_device(self, ip: str) -> bool:
-        """Check if device at IP is a Pixoo device"""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2)
-            sock.connect((ip, self.port))
-
-            # Simple HTTP GET to check response
-            request = "GET / HTTP/1.1\r\nHost: {}\r\n\r\n".format(ip)
-            sock.send(request.encode())
-
-            response = sock.recv(1024).decode()
-            sock.close()
-
-            # Check if response contains Pixoo identifiers
-            return any(keyword in response.lower() for keyword in ['pixoo', 'divoom'])
-
-        except Exception:
-            return False
-
     def get_device_ip(self, device_name: str) -> Optional[str]:
         """Get IP address for discovered device"""
         for device in self.discovered_devices:
@@ -170,6 +314,10 @@ class PixooDiscovery:
         print("-" * 40)
 
 
+# Shared by every sweep so scanning several interfaces doesn't multiply open sockets
+_probe_slots = threading.BoundedSemaphore(PixooDiscovery.MAX_IN_FLIGHT)
+
+
 def test_connection(ip: str) -> bool:
     """Test if we can connect to a Pixoo device at given IP"""
     try:
@@ -4,11 +4,14 @@ Device panel for Pixoo device connection and management
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
+import time
 import re
 
 from config import PixoomatConfig
-from device_discovery import PixooDiscovery, test_connection
-from weather_service import WeatherService
+from device_discovery import DISCOVERY_CACHE_TTL, PixooDiscovery, test_connection
+
+# Extracts the IP from list entries like "Device Name (192.168.1.100)"
+_IP_RE = re.compile(r'\(([\d.]+)\)')
 
 
 class DevicePanel:
@@ -26,6 +29,7 @@ class DevicePanel:
         self.on_device_connected = on_device_connected
         self.config = None
         self.pixoo = None
+        self._last_discover = None  # (time.monotonic(), devices)
 
         # Create main frame
         self.frame = ttk.Frame(parent)
@@ -82,11 +86,14 @@ class DevicePanel:
         discover_frame = ttk.LabelFrame(self.frame, text="Auto Discovery")
         discover_frame.pack(fill=tk.X, pady=(0, 10))
 
-        ttk.Button(
+        discover_button = ttk.Button(
             discover_frame,
             text="Discover Devices",
             command=self._discover_devices
-        ).pack(fill=tk.X, padx=10, pady=5)
+        )
+        discover_button.pack(fill=tk.X, padx=10, pady=5)
+        # Shift-click bypasses the cached results and rescans
+        discover_button.bind('<Shift-Button-1>', self._force_discover)
 
         # Device list
         list_frame = ttk.Frame(discover_frame)
@@ -134,8 +141,14 @@ class DevicePanel:
         self.port_var.set(config.port)
         self.screen_size_var.set(config.screen_size)
 
-    def _discover_devices(self):
-        """Discover Pixoo devices on the network"""
+    def _discover_devices(self, force: bool = False):
+        """Discover Pixoo devices on the network, reusing recent results unless forced"""
+        if not force and self._last_discover:
+            timestamp, devices = self._last_discover
+            if time.monotonic() - timestamp < DISCOVERY_CACHE_TTL:
+                self._update_device_list(devices)
+                return
+
         self.status_var.set("Discovering devices...")
         self.device_listbox.delete(0, tk.END)
 
@@ -143,17 +156,24 @@ class DevicePanel:
             try:
                 discovery = PixooDiscovery(timeout=5)
                 devices = discovery.discover()
+                # An empty scan isn't cached so a device powered on afterwards is found
+                if devices:
+                    self._last_discover = (time.monotonic(), devices)
 
                 # Update UI in main thread
                 self.parent.after(0, lambda: self._update_device_list(devices))
             except Exception as e:
                 self.parent.after(0, lambda: self.status_var.set(f"Discovery failed: {e}"))
 
-        import threading
         thread = threading.Thread(target=discover_in_background)
         thread.daemon = True
         thread.start()
 
+    def _force_discover(self, event):
+        """Rescan the network even if cached results are still fresh"""
+        self._discover_devices(force=True)
+        return "break"
+
     def _update_device_list(self, devices):
         """Update the device list with discovered devices"""
         self.device_listbox.delete(0, tk.END)
@@ -185,9 +205,7 @@ class DevicePanel:
         selected = self.device_listbox.curselection()
         if selected:
             selection_text = self.device_listbox.get(selected[0])
-            # Extract IP from selection text "Device Name (192.168.1.100)"
-            import re
-            match = re.search(r'\(([\d\.]+)\)', selection_text)
+            match = _IP_RE.search(selection_text)
             if match:
                 ip = match.group(1)
                 self.ip_var.set(ip)
@@ -224,7 +242,6 @@ class DevicePanel:
             except Exception as e:
                 self.parent.after(0, lambda: self._on_connection_failed(str(e)))
 
-        import threading
         thread = threading.Thread(target=connect_in_background)
         thread.daemon = True
         thread.start()
@@ -3,28 +3,79 @@ Compact device panel for Pixoo device connection and management
 """
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
+import time
 import re
+import queue
+import threading
 
 from config import PixoomatConfig
-from device_discovery import PixooDiscovery, test_connection
+from device_discovery import DISCOVERY_CACHE_TTL, PixooDiscovery, test_connection
+from pixoo_client import CustomPixoo
+
+
+class _DaemonPool:
+    """Fixed set of daemon worker threads fed from a queue"""
+
+    def __init__(self, workers: int, name: str):
+        self._jobs = queue.SimpleQueue()
+        for i in range(workers):
+            threading.Thread(target=self._run, name=f"{name}_{i}", daemon=True).start()
+
+    def submit(self, fn):
+        """Queue fn to run on the next free worker"""
+        self._jobs.put(fn)
+
+    def _run(self):
+        while True:
+            fn = self._jobs.get()
+            try:
+                fn()
+            except Exception as e:
+                print(f"ERROR: Background network job failed: {e}")
+
+
+# Shared workers for discovery/connection so clicks don't spawn new threads.
+# Daemon threads, so a hung connect or scan never blocks interpreter exit.
+_EXEC = _DaemonPool(2, "pixoo-net")
 
 
 class CompactDevicePanel:
     """Compact panel for managing Pixoo device connection"""
 
-    def __init__(self, parent, on_device_connected=None):
+    # Seconds to wait for devices to answer during discovery
+    DISCOVERY_TIMEOUT = 3
+    # Seconds a verified endpoint can skip the blanking connection test
+    LAST_GOOD_TTL = 300
+
+    # Indicator colors: green, orange, red
+    _STATUS_COLORS = {
+        "connected": "#00aa00",
+        "connecting": "#ffaa00",
+        "disconnected": "#aa0000",
+    }
+
+    # Extracts the IP from entries like "Device Name (192.168.1.100)"
+    _IP_RE = re.compile(r'\(([\d.]+)\)')
+
+    def __init__(self, parent, on_connection_changed=None, on_apply_requested=None):
         """
         Initialize compact device panel
 
         Args:
             parent: Parent tkinter widget
-            on_device_connected: Callback function when device connects
+            on_connection_changed: Callback taking the Pixoo instance on
+                connect, or None on disconnect
+            on_apply_requested: Callback when the user asks to apply the layout
         """
         self.parent = parent
-        self.on_device_connected = on_device_connected
+        self.on_connection_changed = on_connection_changed
+        self.on_apply_requested = on_apply_requested
         self.config = None
         self.pixoo = None
+        self._discovery_cache = None  # (time.monotonic(), devices)
+        self._discovering = False
+        self._last_good = None  # ((ip, port, screen_size), time.monotonic())
+        self._parsed_selection = None  # dropdown text last copied into ip_var
 
         # Create main frame
         self.frame = ttk.Frame(parent)
@@ -55,6 +106,9 @@ class CompactDevicePanel:
 
         # Manual IP entry
         self.ip_var = tk.StringVar()
+        # Keep a stripped copy so connecting doesn't have to query Tcl
+        self._ip_cached = ""
+        self.ip_var.trace_add("write", self._on_ip_changed)
         self.ip_entry = ttk.Entry(conn_frame, textvariable=self.ip_var)
         self.ip_entry.pack(fill=tk.X, pady=(0, 5))
         self.ip_entry.bind('<Return>', lambda e: self._connect_to_device())
@@ -93,6 +147,8 @@ class CompactDevicePanel:
             width=20
         )
         self.discover_button.pack(fill=tk.X, pady=(0, 5))
+        # Shift-click bypasses the cached results and rescans
+        self.discover_button.bind('<Shift-Button-1>', self._force_discover)
 
         # Connection status with indicator
         status_frame = ttk.Frame(self.frame)
@@ -102,7 +158,9 @@ class CompactDevicePanel:
 
         self.status_canvas = tk.Canvas(status_frame, width=12, height=12, highlightthickness=0)
         self.status_canvas.pack(side=tk.LEFT, padx=(5, 5))
-        self._update_status_indicator("disconnected")
+        self._status_dot = self.status_canvas.create_oval(
+            2, 2, 10, 10, fill=self._STATUS_COLORS["disconnected"], outline=""
+        )
 
         self.status_var = tk.StringVar(value="Disconnected")
         self.status_label = ttk.Label(status_frame, textvariable=self.status_var)
@@ -127,18 +185,21 @@ class CompactDevicePanel:
         )
         self.apply_button.pack(fill=tk.X)
 
+    def _set_status(self, message: str, indicator: str, **connect_options):
+        """Update status text, indicator and optionally the connect button in one call"""
+        self.status_var.set(message)
+        self._update_status_indicator(indicator)
+        if connect_options:
+            self.connect_button.config(**connect_options)
+
     def _update_status_indicator(self, status: str):
         """Update connection status indicator"""
-        self.status_canvas.delete("all")
-
-        if status == "connected":
-            color = "#00aa00"  # Green
-        elif status == "connecting":
-            color = "#ffaa00"  # Orange
-        else:
-            color = "#aa0000"  # Red
+        color = self._STATUS_COLORS.get(status, "#aa0000")
+        self.status_canvas.itemconfig(self._status_dot, fill=color)
 
-        self.status_canvas.create_oval(2, 2, 10, 10, fill=color, outline="")
+    def _on_ip_changed(self, *args):
+        """Refresh the cached IP whenever the entry changes"""
+        self._ip_cached = self.ip_var.get().strip()
 
     def set_config(self, config: PixoomatConfig):
         """
@@ -157,62 +218,81 @@ class CompactDevicePanel:
     def _on_device_selected(self, event):
         """Handle device selection from dropdown"""
         selection = self.device_var.get()
+        self._parsed_selection = selection
         if selection and selection != "Manual IP Entry":
-            # Extract IP from selection text "Device Name (192.168.1.100)"
-            match = re.search(r'\(([\d\.]+)\)', selection)
+            match = self._IP_RE.search(selection)
             if match:
                 ip = match.group(1)
                 self.ip_var.set(ip)
 
-    def _discover_devices(self):
-        """Discover Pixoo devices on the network"""
-        self.status_var.set("Discovering...")
-        self._update_status_indicator("connecting")
+    def _discover_devices(self, force: bool = False):
+        """Discover Pixoo devices on the network, reusing recent results unless forced"""
+        # Ignore clicks while a scan is already running
+        if self._discovering:
+            return
+
+        if not force and self._discovery_cache:
+            timestamp, devices = self._discovery_cache
+            if time.monotonic() - timestamp < DISCOVERY_CACHE_TTL:
+                self._update_device_list(devices)
+                return
+
+        self._discovering = True
+        self.discover_button.config(state=tk.DISABLED)
+        self._set_status("Discovering...", "connecting")
         self.device_combo['values'] = []
         self.device_var.set("")
 
         def discover_in_background():
             try:
-                discovery = PixooDiscovery(timeout=5)
+                # Discovery returns as soon as a device answers, so the
+                # timeout only bounds the empty-network case
+                discovery = PixooDiscovery(timeout=self.DISCOVERY_TIMEOUT)
                 devices = discovery.discover()
+                # An empty scan isn't cached so a device powered on afterwards is found
+                if devices:
+                    self._discovery_cache = (time.monotonic(), devices)
 
                 # Update UI in main thread
                 self.parent.after(0, lambda: self._update_device_list(devices))
             except Exception as e:
                 self.parent.after(0, lambda: self._on_discovery_failed(str(e)))
 
-        import threading
-        thread = threading.Thread(target=discover_in_background)
-        thread.daemon = True
-        thread.start()
+        _EXEC.submit(discover_in_background)
+
+    def _force_discover(self, event):
+        """Rescan the network even if cached results are still fresh"""
+        self._discover_devices(force=True)
+        return "break"
+
+    def _discovery_finished(self):
+        """Allow the next discovery once the current one has reported back"""
+        self._discovering = False
+        self.discover_button.config(state=tk.NORMAL)
 
     def _update_device_list(self, devices):
         """Update the device list with discovered devices"""
+        self._discovery_finished()
+
         if not devices:
-            self.status_var.set("No devices found")
-            self._update_status_indicator("disconnected")
+            self._set_status("No devices found", "disconnected")
             return
 
-        device_names = []
-        for device in devices:
-            device_name = device.get('name', 'Unknown')
-            device_ip = device.get('ip', 'N/A')
-            display_text = f"{device_name} ({device_ip})"
-            device_names.append(display_text)
-
-        # Add manual entry option
-        device_names.append("Manual IP Entry")
+        # Device entries plus the manual entry option
+        device_names = tuple(
+            f"{device.get('name', 'Unknown')} ({device.get('ip', 'N/A')})"
+            for device in devices
+        ) + ("Manual IP Entry",)
 
         self.device_combo['values'] = device_names
         self.device_combo.set(device_names[0])
 
-        self.status_var.set(f"Found {len(devices)} device(s)")
-        self._update_status_indicator("disconnected")
+        self._set_status(f"Found {len(devices)} device(s)", "disconnected")
 
     def _on_discovery_failed(self, error: str):
         """Handle discovery failure"""
-        self.status_var.set(f"Discovery failed: {error}")
-        self._update_status_indicator("disconnected")
+        self._discovery_finished()
+        self._set_status(f"Discovery failed: {error}", "disconnected")
 
     def _toggle_connection(self):
         """Toggle connection to device"""
@@ -226,9 +306,11 @@ class CompactDevicePanel:
     def _connect_to_device(self):
         """Connect to selected device"""
         # Get device IP from selection or entry
-        self._on_device_selected(None)  # Update IP from dropdown if needed
+        # Update IP from dropdown unless the selection was already applied
+        if not self._ip_cached or self.device_var.get() != self._parsed_selection:
+            self._on_device_selected(None)
 
-        ip = self.ip_var.get().strip()
+        ip = self._ip_cached
         port = self.port_var.get()
         screen_size = self.screen_size_var.get()
 
@@ -236,13 +318,10 @@ class CompactDevicePanel:
             messagebox.showerror("Error", "Please enter or select a device IP address")
             return
 
-        self.status_var.set("Connecting...")
-        self._update_status_indicator("connecting")
-        self.connect_button.config(state=tk.DISABLED)
+        self._set_status("Connecting...", "connecting", state=tk.DISABLED)
 
         def connect_in_background():
             try:
-                from pixoo_client import CustomPixoo
                 self.pixoo = CustomPixoo(
                     ip,
                     size=screen_size,
@@ -251,9 +330,18 @@ class CompactDevicePanel:
                     port=port
                 )
 
-                # Test connection
-                self.pixoo.fill((0, 0, 0))
-                self.pixoo.push()
+                # Test connection; an endpoint that worked recently only needs
+                # a cheap config query instead of blanking the screen
+                endpoint = (ip, port, screen_size)
+                recently_good = (
+                    self._last_good is not None
+                    and self._last_good[0] == endpoint
+                    and time.monotonic() - self._last_good[1] < self.LAST_GOOD_TTL
+                )
+                if not (recently_good and self.pixoo.validate_connection()):
+                    self.pixoo.fill((0, 0, 0))
+                    self.pixoo.push()
+                self._last_good = (endpoint, time.monotonic())
 
                 # Update config with connection info
                 if self.config:
@@ -267,26 +355,19 @@ class CompactDevicePanel:
             except Exception as e:
                 self.parent.after(0, lambda: self._on_connection_failed(str(e)))
 
-        import threading
-        thread = threading.Thread(target=connect_in_background)
-        thread.daemon = True
-        thread.start()
+        _EXEC.submit(connect_in_background)
 
     def _on_connected(self, ip: str):
         """Handle successful connection"""
-        self.status_var.set(f"Connected to {ip}")
-        self._update_status_indicator("connected")
-        self.connect_button.config(text="🔌 Disconnect", state=tk.NORMAL)
+        self._set_status(f"Connected to {ip}", "connected", text="🔌 Disconnect", state=tk.NORMAL)
         self.apply_button.config(state=tk.NORMAL)
 
-        if self.on_device_connected:
-            self.on_device_connected(self.pixoo)
+        if self.on_connection_changed:
+            self.on_connection_changed(self.pixoo)
 
     def _on_connection_failed(self, error: str):
         """Handle connection failure"""
-        self.status_var.set(f"Connection failed: {error}")
-        self._update_status_indicator("disconnected")
-        self.connect_button.config(state=tk.NORMAL)
+        self._set_status(f"Connection failed: {error}", "disconnected", state=tk.NORMAL)
         self.pixoo = None
 
     def _disconnect_from_device(self):
@@ -300,13 +381,11 @@ class CompactDevicePanel:
                 pass
 
         self.pixoo = None
-        self.status_var.set("Disconnected")
-        self._update_status_indicator("disconnected")
-        self.connect_button.config(text="🔌 Connect", state=tk.NORMAL)
+        self._set_status("Disconnected", "disconnected", text="🔌 Connect", state=tk.NORMAL)
         self.apply_button.config(state=tk.DISABLED)
 
-        if self.on_device_connected:
-            self.on_device_connected(None)
+        if self.on_connection_changed:
+            self.on_connection_changed(None)
 
     def _apply_to_device(self):
         """Apply current layout to device"""
@@ -314,9 +393,8 @@ class CompactDevicePanel:
             messagebox.showwarning("No Device", "Please connect to a device first")
             return
 
-        if self.on_device_connected:
-            # Signal to parent to apply layout
-            self.on_device_connected(('apply', self.pixoo))
+        if self.on_apply_requested:
+            self.on_apply_requested()
 
     def get_pixoo(self):
         """Get the connected Pixoo instance"""
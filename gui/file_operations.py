@@ -5,9 +5,48 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
 
 from layout_manager import LayoutManager
 from config import PixoomatConfig
+from widgets.base_widget import clone_value
+
+# Prefer orjson's C serializer for layouts when it is installed
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    _loads = json.loads
+
+
+def _atomic_write(filename: str, payload: bytes) -> None:
+    """Write payload next to filename and rename it into place"""
+    tmp_filename = filename + '.tmp'
+    try:
+        with open(tmp_filename, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filename, filename)
+    except Exception:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        raise
+
+
+# Validation errors listed in the save confirmation dialog
+MAX_LISTED_ERRORS = 20
+
+# Single worker so saves run off the Tk thread but never overlap each other
+_SAVE_EXEC = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pixoo-save")
 
 
 class FileOperations:
@@ -24,6 +63,10 @@ class FileOperations:
         self.parent = parent
         self.config = config
         self.layout_manager = None
+        # Directory of the most recently opened/saved layout, for file dialogs
+        self._last_dir = os.path.dirname(config.layout_config) if config.layout_config else None
+        # Layout data that last passed validation
+        self._last_valid_data = None
         
         # File filters
         self.layout_filter = [
@@ -67,20 +110,24 @@ class FileOperations:
         filename = filedialog.askopenfilename(
             title="Open Layout",
             filetypes=self.layout_filter,
-            initialdir=os.path.dirname(self.config.layout_config) if self.config.layout_config else None
+            initialdir=self._last_dir
         )
         
         if not filename:
             return False
         
         try:
-            with open(filename, 'r') as f:
-                layout_data = json.load(f)
+            with open(filename, 'rb') as f:
+                layout_data = _loads(f.read())
             
+            # Load in place so the main window keeps sharing this layout
             if self.layout_manager:
+                self.layout_manager.load_from_dict(layout_data)
+            else:
                 self.layout_manager = LayoutManager.from_dict(layout_data)
             
             self.config.layout_config = filename
+            self._last_dir = os.path.dirname(filename)
             return True
             
         except Exception as e:
@@ -92,7 +139,7 @@ class FileOperations:
         Save current layout to file
         
         Returns:
-            True if layout was saved successfully
+            True if the save was started
         """
         if not self.layout_manager:
             messagebox.showwarning("Warning", "No layout to save")
@@ -105,7 +152,8 @@ class FileOperations:
             filename = filedialog.asksaveasfilename(
                 title="Save Layout",
                 defaultextension=".json",
-                filetypes=self.layout_filter
+                filetypes=self.layout_filter,
+                initialdir=self._last_dir
             )
             if not filename:
                 return False
@@ -117,7 +165,7 @@ class FileOperations:
         Save layout to a new file
         
         Returns:
-            True if layout was saved successfully
+            True if the save was started
         """
         if not self.layout_manager:
             messagebox.showwarning("Warning", "No layout to save")
@@ -127,54 +175,75 @@ class FileOperations:
             title="Save Layout As",
             defaultextension=".json",
             filetypes=self.layout_filter,
-            initialdir=os.path.dirname(self.config.layout_config) if self.config.layout_config else None
+            initialdir=self._last_dir
         )
         
         if not filename:
             return False
         
-        if self._save_layout_to_file(filename):
+        def remember_filename():
             self.config.layout_config = filename
-            return True
         
-        return False
+        return self._save_layout_to_file(filename, on_saved=remember_filename)
     
-    def _save_layout_to_file(self, filename: str) -> bool:
+    def _save_layout_to_file(self, filename: str, on_saved=None) -> bool:
         """
-        Save layout to specific file
+        Save layout to specific file in the background
+        
+        The layout is copied and validated on the Tk thread; serialization
+        and the disk write run on a worker thread.
         
         Args:
             filename: Path to save the layout
+            on_saved: Optional callback run on the Tk thread after a successful save
             
         Returns:
-            True if layout was saved successfully
+            True if the save was started
         """
+        layout_manager = self.layout_manager
         try:
-            # Validate layout before saving
-            if self.layout_manager:
-                errors = self.layout_manager.validate_layout()
+            # to_dict shares the widgets' live properties, so detach a copy
+            # that edits made while the worker runs can't reach
+            layout_data = clone_value(layout_manager.to_dict()) if layout_manager else {}
+            
+            # Validate layout before saving, unless this exact layout
+            # already passed validation on a previous save
+            if layout_manager and layout_data != self._last_valid_data:
+                errors = layout_manager.validate_layout()
                 if errors:
-                    error_text = "\\n".join(errors)
+                    # Only list the first few; a dialog can't show hundreds
+                    error_text = "\n".join(errors[:MAX_LISTED_ERRORS])
+                    if len(errors) > MAX_LISTED_ERRORS:
+                        error_text += f"\n...and {len(errors) - MAX_LISTED_ERRORS} more"
                     response = messagebox.askyesno(
                         "Layout Validation Errors",
-                        f"The layout has validation errors:\\n{error_text}\\n\\nSave anyway?"
+                        f"The layout has validation errors:\n{error_text}\n\nSave anyway?"
                     )
                     if not response:
                         return False
-            
-            # Serialize layout
-            layout_data = self.layout_manager.to_dict() if self.layout_manager else {}
-            
-            # Save to file
-            with open(filename, 'w') as f:
-                json.dump(layout_data, f, indent=2)
-            
-            messagebox.showinfo("Success", f"Layout saved to {os.path.basename(filename)}")
-            return True
-            
+                else:
+                    self._last_valid_data = layout_data
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save layout: {e}")
             return False
+        
+        def save_in_background():
+            try:
+                _atomic_write(filename, _dumps(layout_data))
+                self.parent.after(0, lambda: self._on_layout_saved(filename, on_saved))
+            except Exception as e:
+                msg = f"Failed to save layout: {e}"
+                self.parent.after(0, lambda msg=msg: messagebox.showerror("Error", msg))
+        
+        _SAVE_EXEC.submit(save_in_background)
+        return True
+    
+    def _on_layout_saved(self, filename: str, on_saved=None):
+        """Report a finished background save on the Tk thread"""
+        self._last_dir = os.path.dirname(filename)
+        if on_saved:
+            on_saved()
+        messagebox.showinfo("Success", f"Layout saved to {os.path.basename(filename)}")
     
     def save_config(self) -> bool:
         """
@@ -216,10 +285,13 @@ class FileOperations:
             return False
         
         try:
+            # from_file caches by path and mtime, so reopening an unchanged
+            # file skips the disk read and JSON parse
             loaded_config = PixoomatConfig.from_file(filename)
             if loaded_config:
-                # Copy properties to current config
-                self.config.__dict__.update(loaded_config.__dict__)
+                # Copy declared fields to current config
+                for config_field in fields(loaded_config):
+                    setattr(self.config, config_field.name, getattr(loaded_config, config_field.name))
                 messagebox.showinfo("Success", f"Configuration loaded from {os.path.basename(filename)}")
                 return True
         except Exception as e:
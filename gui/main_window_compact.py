@@ -1,10 +1,16 @@
 """
 Compact main GUI window for Pixoomat with improved layout and accessibility
 """
+import json
+import random
+import threading
+import time
 import tkinter as tk
+from collections import defaultdict
+from difflib import SequenceMatcher
 from tkinter import ttk, messagebox, filedialog
-import copy
-from typing import Optional, Union, Tuple, Any
+from functools import lru_cache, partial
+from typing import Optional, Union, Tuple, Any, Dict, List, Callable, NamedTuple
 
 from layout_manager import LayoutManager
 from widgets import get_plugin_manager
@@ -14,9 +20,56 @@ from gui.device_panel_compact import CompactDevicePanel
 from gui.widget_palette import WidgetPalette
 from gui.toolbar import MainToolbar
 from gui.file_operations import FileOperations
-from gui.undo_manager import UndoManager
+from gui.undo_manager import (UndoManager, UndoPatch, MovePatch, AddPatch, RemovePatch,
+                               PropertyPatch, widget_state)
 from weather_service import WeatherService
-from widgets.plugins.weather_widget import WeatherWidget
+
+
+class Theme(NamedTuple):
+    """Window colors for one theme"""
+    bg: str
+    fg: str
+    canvas_bg: str
+    select: str
+
+
+_THEME_NORMAL = Theme(bg='#f0f0f0', fg='#000000', canvas_bg='#2b2b2b', select='#0078d4')
+_THEME_HIGH_CONTRAST = Theme(bg='#000000', fg='#ffffff', canvas_bg='#000000', select='#ffff00')
+
+# Outline colors for widget rectangles on the canvas
+SELECTED_OUTLINE = "yellow"
+UNSELECTED_OUTLINE = "white"
+
+_randint = random.randint
+
+
+def _nobind(fn: Callable[[], Any]) -> Callable[[tk.Event], Any]:
+    """Wrap a no-argument command as an event handler that ignores the event"""
+    return lambda event, f=fn: f()
+
+
+@lru_cache(maxsize=1)
+def _cached_plugin_list() -> Tuple[Any, ...]:
+    """Plugin metadata for the session; call cache_clear() after loading plugins"""
+    return tuple(get_plugin_manager().list_plugins())
+
+
+@lru_cache(maxsize=None)
+def _resolve_widget_class(plugin_name: str) -> Optional[type]:
+    """Widget class registered by a plugin; call cache_clear() after loading plugins"""
+    return get_plugin_manager().get_widget_class(plugin_name)
+
+
+@lru_cache(maxsize=256)
+def _rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
+    """Convert an RGB tuple to a Tk color string"""
+    return f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
+
+
+@lru_cache(maxsize=64)
+def _label_font(size: int) -> Tuple[str, int]:
+    """Font for widget labels at the given point size"""
+    return ("Arial", size)
 
 
 def run_gui(config: PixoomatConfig) -> int:
@@ -38,6 +91,16 @@ def run_gui(config: PixoomatConfig) -> int:
 class CompactPixoomatGUI:
     """Compact main GUI application class with improved layout"""
 
+    # Repeated arrow-key moves or edits of one widget within this many seconds
+    # share a single undo entry
+    UNDO_COALESCE_SECONDS = 0.4
+
+    # An identical apply error within this many seconds only updates the status bar
+    ERROR_POPUP_DEBOUNCE_SECONDS = 2.0
+
+    # Most recycled widgets kept per widget type
+    WIDGET_POOL_SIZE = 16
+
     def __init__(self, root: tk.Tk, config: PixoomatConfig):
         """
         Initialize compact GUI
@@ -52,33 +115,66 @@ class CompactPixoomatGUI:
         # Initialize layout manager
         self.layout_manager = LayoutManager(config.screen_size)
 
-        # GUI elements
+        # GUI elements; the selection setter also caches how far the
+        # selected widget can move
+        self._selected_max_x = 0
+        self._selected_max_y = 0
         self.selected_widget = None
-        self.drag_data = {"x": 0, "y": 0, "widget": None}
+
+        # Drag state: grab offset within the widget and the widget being dragged
+        self._drag_x = 0
+        self._drag_y = 0
+        self._drag_widget = None
+        self._drag_started = False
+        self._drag_origin = (0, 0)
+
+        # Widget shown in the property panel and its state before the next edit
+        self._property_baseline: Optional[Tuple[Any, Dict[str, Any]]] = None
+        # (widget, pending undo operation) for a burst of property edits
+        self._pending_edit: Optional[Tuple[Any, Dict[str, Any]]] = None
+        self._prop_flush_id: Optional[str] = None  # after() id of the trailing-edge commit
+
+        # Persistent canvas items, updated in place by _update_canvas
+        # Items carry no Tk tags; this dict is the only widget <-> item mapping
+        self._canvas_items: Dict[int, Tuple[int, int]] = {}  # id(widget) -> (rect, label)
+        self._canvas_order: Tuple[int, ...] = ()
+        self._background_item: Optional[int] = None
+        self._scene_key = None
+        self._render_sig: Optional[Tuple] = None  # Inputs of the last _update_canvas
+        self._refresh_pending = False
+        self._canvas_dirty = False
+        self._list_dirty = False
+        self._listbox_entries: List[str] = []  # Rows currently shown in widget_listbox
+        self._listbox_to_widget: List[Any] = []  # Widget behind each of those rows
+        self._xform: Optional[Tuple[float, float, float, int, int]] = None
+        self._xform_key = None
+
+        # Hit-test table of the drawn widgets as parallel device-space columns,
+        # rebuilt by _update_canvas in draw (z) order
+        self._hit_x1: List[int] = []
+        self._hit_y1: List[int] = []
+        self._hit_x2: List[int] = []
+        self._hit_y2: List[int] = []
+        self._hit_widgets: Optional[List[Any]] = None
         self.pixoo: Optional[Any] = None
+        self._last_error: Optional[Tuple[str, float]] = None  # (message, time.monotonic())
+        # One apply runs at a time; requests made meanwhile collapse into one rerun
+        self._apply_busy = False
+        self._apply_queued = False
+        # Construction does no I/O; fetching is deferred to _prefetch_weather
         self.weather_service = WeatherService()
+        # Reset widgets dropped with the layout or history, by class name
+        self._widget_pool: Dict[str, List[Any]] = defaultdict(list)
 
         # Zoom and canvas settings
         self.zoom_level = 1.0
         self.min_zoom = 0.5
         self.max_zoom = 3.0
+        self._wheel_accum = 0.0
+        self._wheel_pending = False
 
         # Theme settings
         self.high_contrast = False
-        self.theme_colors = {
-            'normal': {
-                'bg': '#f0f0f0',
-                'fg': '#000000',
-                'canvas_bg': '#2b2b2b',
-                'select': '#0078d4'
-            },
-            'high_contrast': {
-                'bg': '#000000',
-                'fg': '#ffffff',
-                'canvas_bg': '#000000',
-                'select': '#ffff00'
-            }
-        }
 
         # Create component managers
         self.property_panel = None
@@ -108,6 +204,16 @@ class CompactPixoomatGUI:
         # Initialize toolbar state
         self._update_toolbar_state()
 
+        # Start the first weather fetch once the window is up
+        self.root.after_idle(self._prefetch_weather)
+
+    def _prefetch_weather(self):
+        """Warm the weather cache in the background if the layout shows weather"""
+        if any(w.REQUIRES_WEATHER_SERVICE for w in self.layout_manager.widgets):
+            # get_weather never blocks; it starts the location/weather fetch on a
+            # daemon thread so the data is ready before the first device render
+            self.weather_service.get_weather()
+
     def _setup_window(self):
         """Setup main window properties"""
         self.root.title("Pixoomat - Compact Layout Designer")
@@ -143,7 +249,7 @@ class CompactPixoomatGUI:
 
     def _apply_theme(self):
         """Apply current theme to the window"""
-        theme = self.theme_colors['high_contrast' if self.high_contrast else 'normal']
+        theme = _THEME_HIGH_CONTRAST if self.high_contrast else _THEME_NORMAL
         # Note: ttk themes are more complex to change dynamically
         # This is a placeholder for theme application
         pass
@@ -305,6 +411,36 @@ class CompactPixoomatGUI:
         self.canvas.bind("<Button-4>", self._on_mouse_wheel)  # Linux
         self.canvas.bind("<Button-5>", self._on_mouse_wheel)  # Linux
 
+        self._setup_context_menus()
+
+    def _setup_context_menus(self):
+        """Build the canvas context menus once; right-click only pops them up"""
+        # Widget-specific menu
+        self._widget_ctx_menu = tk.Menu(self.root, tearoff=0)
+        self._widget_ctx_menu.add_command(label="Delete", command=self._remove_widget)
+        self._widget_ctx_menu.add_command(label="Duplicate", command=self._duplicate_widget)
+        self._widget_ctx_menu.add_separator()
+        self._widget_ctx_menu.add_command(label="Bring to Front", command=self._bring_to_front)
+        self._widget_ctx_menu.add_command(label="Send to Back", command=self._send_to_back)
+
+        # Canvas-specific menu
+        self._canvas_ctx_menu = tk.Menu(self.root, tearoff=0)
+        self._canvas_ctx_menu.add_command(label="Add Clock", command=self._add_clock_widget)
+        self._canvas_ctx_menu.add_command(label="Add Weather", command=self._add_weather_widget)
+
+        # Add plugin widgets
+        try:
+            plugin_widgets = _cached_plugin_list()
+            if plugin_widgets:
+                self._canvas_ctx_menu.add_separator()
+                for plugin_meta in plugin_widgets:
+                    self._canvas_ctx_menu.add_command(
+                        label=f"Add {plugin_meta.name}",
+                        command=lambda name=plugin_meta.name: self._add_plugin_widget(name)
+                    )
+        except:
+            pass
+
     def _setup_active_widgets_list(self):
         """Setup the active widgets list in the workspace"""
         # Title
@@ -366,7 +502,9 @@ class CompactPixoomatGUI:
         self.right_notebook.add(self.property_panel.frame, text="Properties")
 
         # Device tab
-        self.device_panel = CompactDevicePanel(self.right_notebook, on_device_connected=self._on_device_connected)
+        self.device_panel = CompactDevicePanel(self.right_notebook,
+                                               on_connection_changed=self._on_connection_changed,
+                                               on_apply_requested=self._apply_to_device)
         self.right_notebook.add(self.device_panel.frame, text="Device")
 
         # Set initial config
@@ -374,29 +512,50 @@ class CompactPixoomatGUI:
 
     def _setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts"""
-        self.root.bind('<Control-n>', lambda e: self._new_layout())
-        self.root.bind('<Control-o>', lambda e: self._open_layout())
-        self.root.bind('<Control-s>', lambda e: self._save_layout())
-        self.root.bind('<Control-Shift-S>', lambda e: self._save_layout_as())
-        self.root.bind('<Control-z>', lambda e: self._undo())
-        self.root.bind('<Control-y>', lambda e: self._redo())
-        self.root.bind('<Control-d>', lambda e: self._duplicate_widget())
-        self.root.bind('<Delete>', lambda e: self._remove_widget())
-        self.root.bind('<Control-Home>', lambda e: self._bring_to_front())
-        self.root.bind('<Control-End>', lambda e: self._send_to_back())
-        self.root.bind('<Control-plus>', lambda e: self._zoom_in())
-        self.root.bind('<Control-minus>', lambda e: self._zoom_out())
-        self.root.bind('<Control-0>', lambda e: self._reset_zoom())
-        self.root.bind('<F1>', lambda e: self._show_shortcuts())
-        self.root.bind('<F5>', lambda e: self._preview_layout())
-        self.root.bind('<F9>', lambda e: self._toggle_left_panel())
-        self.root.bind('<F10>', lambda e: self._toggle_right_panel())
-
-        # Arrow keys for widget movement
-        self.root.bind('<Left>', lambda e: self._move_widget(-1, 0))
-        self.root.bind('<Right>', lambda e: self._move_widget(1, 0))
-        self.root.bind('<Up>', lambda e: self._move_widget(0, -1))
-        self.root.bind('<Down>', lambda e: self._move_widget(0, 1))
+        shortcuts = (
+            ('<Control-n>', self._new_layout),
+            ('<Control-o>', self._open_layout),
+            ('<Control-s>', self._save_layout),
+            ('<Control-Shift-S>', self._save_layout_as),
+            ('<Control-z>', self._undo),
+            ('<Control-y>', self._redo),
+            ('<Control-d>', self._duplicate_widget),
+            ('<Delete>', self._remove_widget),
+            ('<Control-Home>', self._bring_to_front),
+            ('<Control-End>', self._send_to_back),
+            ('<Control-plus>', self._zoom_in),
+            ('<Control-minus>', self._zoom_out),
+            ('<Control-0>', self._reset_zoom),
+            ('<F1>', self._show_shortcuts),
+            ('<F5>', self._preview_layout),
+            ('<F9>', self._toggle_left_panel),
+            ('<F10>', self._toggle_right_panel),
+
+            # Arrow keys for widget movement
+            ('<Left>', partial(self._move_widget, -1, 0)),
+            ('<Right>', partial(self._move_widget, 1, 0)),
+            ('<Up>', partial(self._move_widget, 0, -1)),
+            ('<Down>', partial(self._move_widget, 0, 1)),
+        )
+        for sequence, command in shortcuts:
+            self.root.bind(sequence, _nobind(command))
+
+    @property
+    def selected_widget(self):
+        """Widget selected on the canvas and in the widget list"""
+        return self._selected_widget
+
+    @selected_widget.setter
+    def selected_widget(self, widget):
+        self._selected_widget = widget
+        self._update_selected_extents()
+
+    def _update_selected_extents(self):
+        """Cache the furthest position the selected widget can move to"""
+        widget = self._selected_widget
+        if widget is not None:
+            self._selected_max_x = max(0, self.config.screen_size - widget.width)
+            self._selected_max_y = max(0, self.config.screen_size - widget.height)
 
     def update_status(self, message: str):
         """Update status bar message"""
@@ -464,15 +623,58 @@ class CompactPixoomatGUI:
 
     def _on_canvas_resize(self, event):
         """Handle canvas resize for dynamic sizing"""
-        self._update_canvas()
+        self._xform = None
+        self._schedule_refresh()
+
+    def _schedule_refresh(self, canvas: bool = True, widget_list: bool = False):
+        """
+        Mark views dirty and refresh them together on the next idle tick
+
+        Args:
+            canvas: Redraw the canvas
+            widget_list: Refresh the active widgets list
+        """
+        self._canvas_dirty |= canvas
+        self._list_dirty |= widget_list
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after_idle(self._flush_refresh)
+
+    def _flush_refresh(self):
+        """Run the refreshes requested since the last idle tick"""
+        self._refresh_pending = False
+        if self._canvas_dirty:
+            self._canvas_dirty = False
+            self._update_canvas()
+        if self._list_dirty:
+            self._list_dirty = False
+            self._update_active_widgets_list()
 
     def _on_mouse_wheel(self, event):
-        """Handle mouse wheel for zooming"""
-        # Determine scroll direction
-        if event.num == 4 or event.delta > 0:
-            self._zoom_in()
-        elif event.num == 5 or event.delta < 0:
-            self._zoom_out()
+        """Handle mouse wheel for zooming, accumulating notches until idle"""
+        # Determine scroll direction and size in wheel notches
+        if event.num == 4:
+            notches = 1
+        elif event.num == 5:
+            notches = -1
+        elif abs(event.delta) >= 120:
+            notches = event.delta / 120
+        else:
+            # macOS reports small deltas; count each event as one notch
+            notches = (event.delta > 0) - (event.delta < 0)
+
+        self._wheel_accum += notches
+        if not self._wheel_pending:
+            self._wheel_pending = True
+            self.root.after_idle(self._apply_wheel_zoom)
+
+    def _apply_wheel_zoom(self):
+        """Apply the accumulated wheel notches as a single zoom change"""
+        self._wheel_pending = False
+        steps = int(self._wheel_accum)
+        self._wheel_accum -= steps
+        if steps:
+            self._set_zoom(self.zoom_level * 1.2 ** steps)
 
     def _on_canvas_right_click(self, event):
         """Handle right click on canvas for context menu"""
@@ -480,40 +682,12 @@ class CompactPixoomatGUI:
         canvas_x = self.canvas.canvasx(event.x)
         canvas_y = self.canvas.canvasy(event.y)
 
-        # Convert to device coordinates
-        device_x, device_y = self._canvas_to_device_coords(canvas_x, canvas_y)
-
-        # Check if clicking on a widget
-        widget = self.layout_manager.get_widget_at(device_x, device_y)
+        # Check if clicking on a widget; clicks in the margin skip the hit test
+        widget = None
+        if self._on_device_area(canvas_x, canvas_y):
+            widget = self._widget_at(*self._canvas_to_device_coords(canvas_x, canvas_y))
 
-        # Create context menu
-        context_menu = tk.Menu(self.root, tearoff=0)
-
-        if widget:
-            # Widget-specific menu
-            context_menu.add_command(label="Delete", command=self._remove_widget)
-            context_menu.add_command(label="Duplicate", command=self._duplicate_widget)
-            context_menu.add_separator()
-            context_menu.add_command(label="Bring to Front", command=self._bring_to_front)
-            context_menu.add_command(label="Send to Back", command=self._send_to_back)
-        else:
-            # Canvas-specific menu
-            context_menu.add_command(label="Add Clock", command=self._add_clock_widget)
-            context_menu.add_command(label="Add Weather", command=self._add_weather_widget)
-
-            # Add plugin widgets
-            try:
-                plugin_manager = get_plugin_manager()
-                plugin_widgets = plugin_manager.list_plugins()
-                if plugin_widgets:
-                    context_menu.add_separator()
-                    for plugin_meta in plugin_widgets:
-                        context_menu.add_command(
-                            label=f"Add {plugin_meta.name}",
-                            command=lambda name=plugin_meta.name: self._add_plugin_widget(name)
-                        )
-            except:
-                pass
+        context_menu = self._widget_ctx_menu if widget else self._canvas_ctx_menu
 
         # Show menu
         try:
@@ -521,152 +695,231 @@ class CompactPixoomatGUI:
         finally:
             context_menu.grab_release()
 
-    def _canvas_to_device_coords(self, canvas_x: float, canvas_y: float) -> Tuple[int, int]:
-        """Convert canvas coordinates to device coordinates"""
-        # Get canvas dimensions
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-
-        if canvas_width <= 1 or canvas_height <= 1:
-            return 0, 0
-
-        # Calculate scale factor
-        scale_x = canvas_width / self.config.screen_size
-        scale_y = canvas_height / self.config.screen_size
-        scale = min(scale_x, scale_y) * self.zoom_level
-
-        # Calculate offset to center the device
-        device_width = self.config.screen_size * scale
-        device_height = self.config.screen_size * scale
-        offset_x = (canvas_width - device_width) / 2
-        offset_y = (canvas_height - device_height) / 2
-
-        # Convert coordinates
-        device_x = int((canvas_x - offset_x) / scale)
-        device_y = int((canvas_y - offset_y) / scale)
+    def _get_xform(self) -> Tuple[float, float, float, int, int]:
+        """
+        Get the device-to-canvas transform, cached until resize or zoom
 
-        return device_x, device_y
+        Returns:
+            Tuple of (scale, offset_x, offset_y, canvas_width, canvas_height)
+        """
+        key = (self.zoom_level, self.config.screen_size)
+        if self._xform is not None and self._xform_key == key:
+            return self._xform
 
-    def _device_to_canvas_coords(self, device_x: int, device_y: int) -> Tuple[float, float]:
-        """Convert device coordinates to canvas coordinates"""
         # Get canvas dimensions
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
-
-        if canvas_width <= 1 or canvas_height <= 1:
-            return 0, 0
+        mapped = canvas_width > 1 and canvas_height > 1
+        if not mapped:
+            canvas_width = 800
+            canvas_height = 600
 
         # Calculate scale factor
-        scale_x = canvas_width / self.config.screen_size
-        scale_y = canvas_height / self.config.screen_size
-        scale = min(scale_x, scale_y) * self.zoom_level
+        screen_size = self.config.screen_size
+        scale = min(canvas_width / screen_size, canvas_height / screen_size) * self.zoom_level
 
         # Calculate offset to center the device
-        device_width = self.config.screen_size * scale
-        device_height = self.config.screen_size * scale
-        offset_x = (canvas_width - device_width) / 2
-        offset_y = (canvas_height - device_height) / 2
+        offset_x = (canvas_width - screen_size * scale) / 2
+        offset_y = (canvas_height - screen_size * scale) / 2
+
+        xform = (scale, offset_x, offset_y, canvas_width, canvas_height)
+        if mapped:
+            # Sizes are only final once the canvas is mapped
+            self._xform = xform
+            self._xform_key = key
+        return xform
+
+    def _on_device_area(self, canvas_x: float, canvas_y: float) -> bool:
+        """Check whether a canvas point lies on the device screen, not the margin"""
+        scale, offset_x, offset_y, _, _ = self._get_xform()
+        extent = self.config.screen_size * scale
+        return offset_x <= canvas_x < offset_x + extent and offset_y <= canvas_y < offset_y + extent
 
-        # Convert coordinates
-        canvas_x = device_x * scale + offset_x
-        canvas_y = device_y * scale + offset_y
+    def _canvas_to_device_coords(self, canvas_x: float, canvas_y: float) -> Tuple[int, int]:
+        """Convert canvas coordinates to device coordinates"""
+        scale, offset_x, offset_y, _, _ = self._get_xform()
+        return int((canvas_x - offset_x) / scale), int((canvas_y - offset_y) / scale)
 
-        return canvas_x, canvas_y
+    def _device_to_canvas_coords(self, device_x: int, device_y: int) -> Tuple[float, float]:
+        """Convert device coordinates to canvas coordinates"""
+        scale, offset_x, offset_y, _, _ = self._get_xform()
+        return device_x * scale + offset_x, device_y * scale + offset_y
 
     def _update_canvas(self):
         """Update canvas to reflect current layout"""
-        # Clear canvas
-        self.canvas.delete("all")
+        scale, offset_x, offset_y, canvas_width, canvas_height = self._get_xform()
+        device_width = device_height = self.config.screen_size * scale
 
-        # Get canvas dimensions
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-
-        if canvas_width <= 1 or canvas_height <= 1:
-            canvas_width = 800
-            canvas_height = 600
+        # Canvas items are created through tk.call directly, skipping the
+        # option flattening done by create_rectangle/create_text
+        tkcall = self.canvas.tk.call
+        cw = self.canvas._w
 
-        # Calculate scale factor
-        scale_x = canvas_width / self.config.screen_size
-        scale_y = canvas_height / self.config.screen_size
-        scale = min(scale_x, scale_y) * self.zoom_level
-
-        # Calculate offset to center the device
-        device_width = self.config.screen_size * scale
-        device_height = self.config.screen_size * scale
-        offset_x = (canvas_width - device_width) / 2
-        offset_y = (canvas_height - device_height) / 2
-
-        # Update scroll region
-        self.canvas.configure(scrollregion=(0, 0, canvas_width, canvas_height))
-
-        # Draw device border
-        self.canvas.create_rectangle(
-            offset_x, offset_y,
-            offset_x + device_width, offset_y + device_height,
-            outline="gray", width=2
-        )
-
-        # Draw background
+        # Background only changes with canvas size, zoom or color
         bg_color = self.layout_manager.background_color
-        bg_hex = f"#{bg_color[0]:02x}{bg_color[1]:02x}{bg_color[2]:02x}"
-        self.canvas.create_rectangle(
-            offset_x, offset_y,
-            offset_x + device_width, offset_y + device_height,
-            fill=bg_hex, outline=""
-        )
-
-        # Draw widgets
+        bg_hex = _rgb_to_hex(tuple(bg_color))
+        scene_key = (canvas_width, canvas_height, scale, bg_hex)
+        scene_changed = scene_key != self._scene_key
+        if scene_changed:
+            self._scene_key = scene_key
+
+            # Update scroll region
+            self.canvas.configure(scrollregion=(0, 0, canvas_width, canvas_height))
+
+            # Device background and its border as one item: a 1px outline just
+            # outside the device area shows the same edge as a separate
+            # 2px border half-covered by the fill
+            device_box = (offset_x - 0.5, offset_y - 0.5,
+                          offset_x + device_width + 0.5, offset_y + device_height + 0.5)
+            if self._background_item is None:
+                self._background_item = tkcall(cw, 'create', 'rectangle', *device_box,
+                                               '-fill', bg_hex, '-outline', 'gray', '-width', 1)
+            else:
+                tkcall(cw, 'coords', self._background_item, *device_box)
+                tkcall(cw, 'itemconfigure', self._background_item, '-fill', bg_hex)
+
+        # Visible part of the canvas, for culling widgets that would not show
+        view_x0 = self.canvas.canvasx(0)
+        view_y0 = self.canvas.canvasy(0)
+        view_x1 = self.canvas.canvasx(canvas_width)
+        view_y1 = self.canvas.canvasy(canvas_height)
+
+        # Everything drawn below depends only on these; a refresh after a no-op
+        # property edit or a move clamped at the edge stops here
+        signature = (scene_key, self.zoom_level, view_x0, view_y0, self.selected_widget,
+                     tuple([(w, w.x, w.y, w.width, w.height, w.visible)
+                            for w in self.layout_manager.widgets]))
+        if signature == self._render_sig:
+            return
+        self._render_sig = signature
+
+        # Draw widgets, reusing the items of widgets already on the canvas
+        font = _label_font(int(10 * self.zoom_level))
+        items = self._canvas_items
+        stale = set(items)
+        order = []
+        hit_x1, hit_y1, hit_x2, hit_y2, hit_widgets = [], [], [], [], []
+
+        # Hoist everything the loop touches per widget into locals
+        selected = self.selected_widget
+        selected_outline, unselected_outline = SELECTED_OUTLINE, UNSELECTED_OUTLINE
+        items_get = items.get
+        stale_discard = stale.discard
+        order_append = order.append
         for widget in self.layout_manager.widgets:
             if not widget.visible:
                 continue
 
+            wx, wy = widget.x, widget.y
+            wx2, wy2 = wx + widget.width, wy + widget.height
+            hit_x1.append(wx)
+            hit_y1.append(wy)
+            hit_x2.append(wx2)
+            hit_y2.append(wy2)
+            hit_widgets.append(widget)
+
             # Calculate widget position and size on canvas
-            x1, y1 = self._device_to_canvas_coords(widget.x, widget.y)
-            x2, y2 = self._device_to_canvas_coords(widget.x + widget.width, widget.y + widget.height)
-
-            # Draw widget rectangle
-            outline_color = "yellow" if widget == self.selected_widget else "white"
-            self.canvas.create_rectangle(
-                x1, y1, x2, y2,
-                fill="", outline=outline_color, width=2,
-                tags=f"widget_{id(widget)}"
-            )
-
-            # Draw widget label
+            x1 = wx * scale + offset_x
+            y1 = wy * scale + offset_y
+            x2 = wx2 * scale + offset_x
+            y2 = wy2 * scale + offset_y
+
+            # Skip offscreen and zero-area widgets; stale items are removed below
+            if (x2 < view_x0 or x1 > view_x1 or y2 < view_y0 or y1 > view_y1
+                    or x2 - x1 < 1 or y2 - y1 < 1):
+                continue
+
+            outline_color = selected_outline if widget is selected else unselected_outline
             widget_type = widget.__class__.__name__.replace("Widget", "")
-            self.canvas.create_text(
-                (x1 + x2) / 2, (y1 + y2) / 2,
-                text=widget_type, fill="white",
-                font=("Arial", int(10 * self.zoom_level)),
-                tags=f"widget_{id(widget)}"
-            )
+
+            key = id(widget)
+            order_append(key)
+            pair = items_get(key)
+            if pair is None:
+                # Draw widget rectangle
+                rect = tkcall(cw, 'create', 'rectangle', x1, y1, x2, y2,
+                              '-fill', '', '-outline', outline_color, '-width', 2)
+                # Draw widget label
+                label = tkcall(cw, 'create', 'text', (x1 + x2) / 2, (y1 + y2) / 2,
+                               '-text', widget_type, '-fill', 'white', '-font', font)
+                items[key] = (rect, label)
+                continue
+
+            stale_discard(key)
+            rect, label = pair
+            tkcall(cw, 'coords', rect, x1, y1, x2, y2)
+            tkcall(cw, 'itemconfigure', rect, '-outline', outline_color)
+            tkcall(cw, 'coords', label, (x1 + x2) / 2, (y1 + y2) / 2)
+            tkcall(cw, 'itemconfigure', label, '-text', widget_type)
+            if scene_changed:
+                tkcall(cw, 'itemconfigure', label, '-font', font)
+
+        # Remove items of widgets that were deleted, hidden or culled
+        for key in stale:
+            tkcall(cw, 'delete', *items.pop(key))
+
+        # Restack only when the z-order of the drawn widgets changed
+        order = tuple(order)
+        if order != self._canvas_order:
+            for key in order:
+                rect, label = items[key]
+                tkcall(cw, 'raise', rect)
+                tkcall(cw, 'raise', label)
+        self._canvas_order = order
+
+        self._hit_x1, self._hit_y1 = hit_x1, hit_y1
+        self._hit_x2, self._hit_y2 = hit_x2, hit_y2
+        self._hit_widgets = hit_widgets
+
+    def _widget_at(self, device_x: int, device_y: int):
+        """
+        Find the top-most drawn widget at a device position
+
+        Args:
+            device_x: X coordinate in device pixels
+            device_y: Y coordinate in device pixels
+
+        Returns:
+            Widget at position or None if no widget found
+        """
+        widgets = self._hit_widgets
+        if widgets is None:
+            # Nothing drawn yet
+            return self.layout_manager.get_widget_at(device_x, device_y)
+
+        x1, y1, x2, y2 = self._hit_x1, self._hit_y1, self._hit_x2, self._hit_y2
+        for i in range(len(widgets) - 1, -1, -1):
+            if x1[i] <= device_x <= x2[i] and y1[i] <= device_y <= y2[i]:
+                return widgets[i]
+        return None
+
+    def _set_zoom(self, level: float):
+        """Set canvas zoom, clamped to the allowed range"""
+        level = max(self.min_zoom, min(level, self.max_zoom))
+        if level != self.zoom_level:
+            self.zoom_level = level
+            self.zoom_var.set(f"{int(self.zoom_level * 100)}%")
+            self._schedule_refresh()
 
     def _zoom_in(self):
         """Zoom in canvas"""
-        if self.zoom_level < self.max_zoom:
-            self.zoom_level = min(self.zoom_level * 1.2, self.max_zoom)
-            self.zoom_var.set(f"{int(self.zoom_level * 100)}%")
-            self._update_canvas()
+        self._set_zoom(self.zoom_level * 1.2)
 
     def _zoom_out(self):
         """Zoom out canvas"""
-        if self.zoom_level > self.min_zoom:
-            self.zoom_level = max(self.zoom_level / 1.2, self.min_zoom)
-            self.zoom_var.set(f"{int(self.zoom_level * 100)}%")
-            self._update_canvas()
+        self._set_zoom(self.zoom_level / 1.2)
 
     def _reset_zoom(self):
         """Reset canvas zoom"""
         self.zoom_level = 1.0
         self.zoom_var.set("100%")
-        self._update_canvas()
+        self._schedule_refresh()
 
     def _toggle_high_contrast(self):
         """Toggle high contrast theme"""
         self.high_contrast = not self.high_contrast
         self._apply_theme()
-        self._update_canvas()
+        self._schedule_refresh()
 
     def _toggle_left_panel(self):
         """Toggle left panel visibility"""
@@ -750,139 +1003,238 @@ Features:
 
     def _on_canvas_click(self, event):
         """Handle canvas click"""
-        # Convert canvas coordinates to device coordinates
-        device_x, device_y = self._canvas_to_device_coords(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+        canvas_x = self.canvas.canvasx(event.x)
+        canvas_y = self.canvas.canvasy(event.y)
 
-        # Check if coordinates are within device bounds
-        if device_x < 0 or device_x >= self.config.screen_size or \
-           device_y < 0 or device_y >= self.config.screen_size:
+        # Ignore clicks in the margin around the device before any conversion
+        if not self._on_device_area(canvas_x, canvas_y):
             return
 
+        # Convert canvas coordinates to device coordinates
+        device_x, device_y = self._canvas_to_device_coords(canvas_x, canvas_y)
+
         # Find widget at position
-        widget = self.layout_manager.get_widget_at(device_x, device_y)
+        widget = self._widget_at(device_x, device_y)
 
         if widget:
             # Select widget
             self.selected_widget = widget
-            self.drag_data = {"x": device_x - widget.x, "y": device_y - widget.y, "widget": widget}
+            self._drag_x = device_x - widget.x
+            self._drag_y = device_y - widget.y
+            self._drag_widget = widget
 
             # Update property panel
-            if self.property_panel:
-                self.property_panel.set_widget(widget)
+            self._show_properties(widget)
         else:
             # Deselect
             self.selected_widget = None
-            self.drag_data = {"x": 0, "y": 0, "widget": None}
-            if self.property_panel:
-                self.property_panel.set_widget(None)
+            self._drag_widget = None
+            self._show_properties(None)
 
         # Update canvas and widget list
-        self._update_canvas()
-        self._update_active_widgets_list()
+        self._schedule_refresh(widget_list=True)
 
         # Update toolbar state
         self._update_toolbar_state()
 
     def _on_canvas_drag(self, event):
         """Handle canvas drag"""
-        if not self.drag_data["widget"]:
+        widget = self._drag_widget
+        if not widget:
             return
 
         # Convert canvas coordinates to device coordinates
         device_x, device_y = self._canvas_to_device_coords(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
 
         # Calculate new widget position
-        widget = self.drag_data["widget"]
-        new_x = device_x - self.drag_data["x"]
-        new_y = device_y - self.drag_data["y"]
+        new_x = device_x - self._drag_x
+        new_y = device_y - self._drag_y
 
         # Ensure widget stays within bounds
-        new_x = max(0, min(new_x, self.config.screen_size - widget.width))
-        new_y = max(0, min(new_y, self.config.screen_size - widget.height))
-
-        # Save state for undo on first drag
-        if not hasattr(self, '_drag_started') or not self._drag_started:
-            layout_state = copy.deepcopy(self.layout_manager.to_dict())
-            self.undo_manager.save_state("Moved widget", layout_state)
+        # The dragged widget is the selected one
+        new_x = min(max(new_x, 0), self._selected_max_x)
+        new_y = min(max(new_y, 0), self._selected_max_y)
+
+        # Remember where the drag began; undo history is recorded on release
+        if not self._drag_started:
+            self._commit_pending_edit()
+            self._drag_origin = (widget.x, widget.y)
             self._drag_started = True
 
         # Update widget position
         widget.set_position(new_x, new_y)
 
-        # Update display
-        self._update_canvas()
-        self._update_active_widgets_list()
+        # Only move the dragged widget's items; the full redraw waits for release
+        self._preview_drag(widget)
 
-        # Update toolbar state
-        self._update_toolbar_state()
+    def _preview_drag(self, widget):
+        """Move a dragged widget's canvas items without redrawing the scene"""
+        pair = self._canvas_items.get(id(widget))
+        if pair is None:
+            self._schedule_refresh()
+            return
+
+        x1, y1 = self._device_to_canvas_coords(widget.x, widget.y)
+        x2, y2 = self._device_to_canvas_coords(widget.x + widget.width, widget.y + widget.height)
+        rect, label = pair
+        self.canvas.coords(rect, x1, y1, x2, y2)
+        self.canvas.coords(label, (x1 + x2) / 2, (y1 + y2) / 2)
 
     def _on_canvas_release(self, event):
         """Handle canvas release"""
-        self.drag_data = {"x": 0, "y": 0, "widget": None}
+        widget = self._drag_widget
+        dragged = self._drag_started
+        self._drag_widget = None
         self._drag_started = False
 
+        if dragged:
+            if (widget.x, widget.y) != self._drag_origin:
+                self._push_undo("Moved widget",
+                                MovePatch(widget, self._drag_origin, (widget.x, widget.y)))
+
+            # Bring the rest of the UI up to date once the drag is finished
+            self._schedule_refresh(widget_list=True)
+            self._update_toolbar_state()
+
     def _move_widget(self, dx: int, dy: int):
         """Move selected widget by offset"""
         if not self.selected_widget:
             return
 
-        # Save state for undo
-        layout_state = copy.deepcopy(self.layout_manager.to_dict())
-        self.undo_manager.save_state("Moved widget", layout_state)
-
         # Update position
-        new_x = max(0, min(self.selected_widget.x + dx, self.config.screen_size - self.selected_widget.width))
-        new_y = max(0, min(self.selected_widget.y + dy, self.config.screen_size - self.selected_widget.height))
+        widget = self.selected_widget
+        old_xy = (widget.x, widget.y)
+        new_x = min(max(widget.x + dx, 0), self._selected_max_x)
+        new_y = min(max(widget.y + dy, 0), self._selected_max_y)
+        if (new_x, new_y) == old_xy:
+            return
 
-        self.selected_widget.set_position(new_x, new_y)
+        self._commit_pending_edit()
+        widget.set_position(new_x, new_y)
+
+        # Save move for undo
+        self._push_undo("Moved widget", MovePatch(widget, old_xy, (new_x, new_y)), coalesce=True)
 
         # Update display
-        self._update_canvas()
-        self._update_active_widgets_list()
+        self._schedule_refresh(widget_list=True)
 
         # Update toolbar state
         self._update_toolbar_state()
 
     def _on_property_changed(self, widget):
         """Handle property change"""
-        self._update_canvas()
-        self._update_active_widgets_list()
+        self._schedule_refresh(widget_list=True)
 
-        # Save state for undo
-        if widget:
-            layout_state = copy.deepcopy(self.layout_manager.to_dict())
-            self.undo_manager.save_state(f"Modified {widget.__class__.__name__}", layout_state)
+        if not widget:
+            return
+
+        # The panel may have given the widget a new z-index or size
+        self.layout_manager.note_z_index(widget)
+        self._update_selected_extents()
 
-    def _on_device_connected(self, pixoo_or_action):
-        """Handle device connection"""
-        if isinstance(pixoo_or_action, tuple) and pixoo_or_action[0] == 'apply':
-            # Apply layout request
+        # A burst of edits to one widget extends the pending undo entry,
+        # whose diff is only taken once the burst is over
+        pending = self._pending_edit
+        if (pending is not None and pending[0] is widget
+                and self.undo_manager.is_pending(pending[1])):
+            self._schedule_prop_flush()
+            return
+
+        self._commit_pending_edit()
+        baseline = self._property_baseline
+        if baseline is None or baseline[0] is not widget:
+            self._property_baseline = (widget, widget_state(widget))
+            return
+
+        old_state = baseline[1]
+
+        def finalize():
+            # Save the fields that changed since the widget was last captured
+            new_state = widget_state(widget)
+            if self._property_baseline is not None and self._property_baseline[0] is widget:
+                self._property_baseline = (widget, new_state)
+            return PropertyPatch.between(widget, old_state, new_state)
+
+        operation = self.undo_manager.mark_pending(f"Modified {widget.__class__.__name__}", finalize)
+        self._pending_edit = (widget, operation)
+        self._schedule_prop_flush()
+
+    def _schedule_prop_flush(self):
+        """Commit the pending property edit once edits pause for UNDO_COALESCE_SECONDS"""
+        if self._prop_flush_id is not None:
+            self.root.after_cancel(self._prop_flush_id)
+        self._prop_flush_id = self.root.after(int(self.UNDO_COALESCE_SECONDS * 1000),
+                                              self._flush_prop_undo)
+
+    def _flush_prop_undo(self):
+        """Trailing edge of a burst of property edits"""
+        self._prop_flush_id = None
+        self._commit_pending_edit()
+        self._update_toolbar_state()
+
+    def _commit_pending_edit(self):
+        """Capture a pending property edit before anything else changes the widget"""
+        if self._prop_flush_id is not None:
+            self.root.after_cancel(self._prop_flush_id)
+            self._prop_flush_id = None
+        if self._pending_edit is not None:
+            self._pending_edit = None
+            self.undo_manager.commit_pending()
+
+    def _show_properties(self, widget):
+        """Show a widget (or nothing) in the property panel and capture its state"""
+        self._property_baseline = (widget, widget_state(widget)) if widget else None
+        if self.property_panel:
+            self.property_panel.set_widget(widget)
+
+    def _push_undo(self, description: str, patch: UndoPatch, coalesce: bool = False):
+        """
+        Record an applied change in the undo history
+
+        Args:
+            description: Description of the operation
+            patch: Patch that redoes the change
+            coalesce: Fold into the previous entry if it is the same kind of
+                change to the same widget made within UNDO_COALESCE_SECONDS
+        """
+        merge_within = self.UNDO_COALESCE_SECONDS if coalesce else 0
+        self.undo_manager.save_state(description, patch, merge_within=merge_within)
+
+        # Keep the property baseline in step with the widget the patch touched
+        baseline = self._property_baseline
+        if baseline is not None and baseline[0] is patch.widget:
+            self._refresh_property_baseline()
+
+    def _refresh_property_baseline(self):
+        """Recapture the property baseline after a change made outside the property panel"""
+        baseline = self._property_baseline
+        if baseline is not None:
+            self._property_baseline = (baseline[0], widget_state(baseline[0]))
+
+    def _on_connection_changed(self, pixoo):
+        """Handle device connection or disconnection"""
+        self.pixoo = pixoo
+        # Connecting may have changed the configured screen size
+        self._update_selected_extents()
+        if pixoo:
+            self.update_status("Connected to device")
+            device_info = None
+            if hasattr(self, 'device_panel') and self.device_panel:
+                device_info = getattr(self.device_panel, 'device_info', None)
+            if self.toolbar:
+                self.toolbar.set_connection_state(True, device_info)
+            # Apply current layout to device
             self._apply_to_device()
         else:
-            # Connection state change
-            self.pixoo = pixoo_or_action
-            if pixoo_or_action:
-                self.update_status("Connected to device")
-                device_info = None
-                if hasattr(self, 'device_panel') and self.device_panel:
-                    device_info = getattr(self.device_panel, 'device_info', None)
-                if self.toolbar:
-                    self.toolbar.set_connection_state(True, device_info)
-                # Apply current layout to device
-                self._apply_to_device()
-            else:
-                self.update_status("Disconnected from device")
-                if self.toolbar:
-                    self.toolbar.set_connection_state(False)
+            self.update_status("Disconnected from device")
+            if self.toolbar:
+                self.toolbar.set_connection_state(False)
 
-            # Update toolbar state
-            self._update_toolbar_state()
+        # Update toolbar state
+        self._update_toolbar_state()
 
     def _add_widget(self, widget):
         """Add a widget to the layout"""
-        # Save state for undo
-        layout_state = copy.deepcopy(self.layout_manager.to_dict())
-
         # Validate and adjust widget dimensions to fit within canvas boundaries
         if widget.width > self.config.screen_size:
             widget.width = self.config.screen_size
@@ -896,9 +1248,8 @@ Features:
         max_x = max(0, self.config.screen_size - widget.width)
         max_y = max(0, self.config.screen_size - widget.height)
 
-        import random
-        x = random.randint(0, max_x)
-        y = random.randint(0, max_y)
+        x = _randint(0, max_x)
+        y = _randint(0, max_y)
 
         widget.set_position(x, y)
 
@@ -906,36 +1257,55 @@ Features:
         self.layout_manager.add_widget(widget)
 
         # Save undo state
-        self.undo_manager.save_state("Added widget", layout_state)
+        self._push_undo("Added widget", AddPatch(widget, self.layout_manager.widgets.index(widget)))
 
         # Update display
-        self._update_canvas()
-        self._update_active_widgets_list()
+        self._schedule_refresh(widget_list=True)
 
         # Update toolbar state
         self._update_toolbar_state()
 
+    def _create_widget(self, plugin_name: str):
+        """Create a widget from a plugin, reusing a pooled instance when there is one"""
+        widget_class = _resolve_widget_class(plugin_name)
+        if widget_class is None:
+            return None
+
+        pool = self._widget_pool.get(widget_class.__name__)
+        # Plugins create their widgets with default arguments, so the
+        # class can be instantiated directly
+        widget = pool.pop() if pool else widget_class()
+        self._connect_weather(widget)
+        return widget
+
+    def _connect_weather(self, widget):
+        """Give a widget that needs weather data the shared weather service"""
+        if widget.REQUIRES_WEATHER_SERVICE:
+            widget.get_weather_data = self.weather_service.get_weather
+
+    def _recycle_widgets(self, widgets):
+        """Reset widgets nothing refers to any more and pool them for reuse"""
+        for widget in widgets:
+            pool = self._widget_pool[type(widget).__name__]
+            if len(pool) < self.WIDGET_POOL_SIZE:
+                widget.reset()
+                pool.append(widget)
+
     def _add_clock_widget(self):
         """Add a clock widget"""
-        plugin_manager = get_plugin_manager()
-        widget = plugin_manager.create_widget("Clock")
+        widget = self._create_widget("Clock")
         if widget:
             self._add_widget(widget)
 
     def _add_weather_widget(self):
         """Add a weather widget"""
-        plugin_manager = get_plugin_manager()
-        widget = plugin_manager.create_widget("Weather")
+        widget = self._create_widget("Weather")
         if widget:
-            # Connect weather service
-            if hasattr(widget, 'get_weather_data') and isinstance(widget, WeatherWidget):
-                widget.get_weather_data = self.weather_service.get_weather
             self._add_widget(widget)
 
     def _add_plugin_widget(self, plugin_name: str):
         """Add a plugin widget"""
-        plugin_manager = get_plugin_manager()
-        widget = plugin_manager.create_widget(plugin_name)
+        widget = self._create_widget(plugin_name)
         if widget:
             self._add_widget(widget)
         else:
@@ -946,104 +1316,98 @@ Features:
         if not self.selected_widget:
             return
 
-        # Save state for undo
-        layout_state = copy.deepcopy(self.layout_manager.to_dict())
+        widget = self.selected_widget
+        index = self.layout_manager.widgets.index(widget)
 
-        self.layout_manager.remove_widget(self.selected_widget)
+        self.layout_manager.remove_widget(widget)
         self.selected_widget = None
-        if self.property_panel:
-            self.property_panel.set_widget(None)
+        self._show_properties(None)
 
         # Save undo state
-        self.undo_manager.save_state("Removed widget", layout_state)
+        self._push_undo("Removed widget", RemovePatch(widget, index))
 
         # Update display
-        self._update_canvas()
-        self._update_active_widgets_list()
+        self._schedule_refresh(widget_list=True)
 
     def _move_widget_up(self):
         """Move selected widget up in z-order"""
+        self._commit_pending_edit()
         selection = self._get_selected_widget_index()
         if selection is not None and selection > 0:
-            # Swap widgets
-            widgets = self.layout_manager.widgets
-            widgets[selection], widgets[selection - 1] = widgets[selection - 1], widgets[selection]
+            self._swap_layers(selection, selection - 1)
+            self._refresh_property_baseline()
+            self.selected_widget = self.layout_manager.widgets[selection - 1]
 
-            # Update z-index values
-            for i, widget in enumerate(widgets):
-                widget.z_index = i
-
-            # Update display
-            self._update_canvas()
-            self._update_active_widgets_list()
-            self._select_widget_in_list(selection - 1)
+            # Update display; the list refresh reselects the moved widget
+            self._schedule_refresh(widget_list=True)
 
     def _move_widget_down(self):
         """Move selected widget down in z-order"""
+        self._commit_pending_edit()
         selection = self._get_selected_widget_index()
         if selection is not None and selection < len(self.layout_manager.widgets) - 1:
-            # Swap widgets
-            widgets = self.layout_manager.widgets
-            widgets[selection], widgets[selection + 1] = widgets[selection + 1], widgets[selection]
-
-            # Update z-index values
-            for i, widget in enumerate(widgets):
-                widget.z_index = i
-
-            # Update display
-            self._update_canvas()
-            self._update_active_widgets_list()
-            self._select_widget_in_list(selection + 1)
+            self._swap_layers(selection, selection + 1)
+            self._refresh_property_baseline()
+            self.selected_widget = self.layout_manager.widgets[selection + 1]
+
+            # Update display; the list refresh reselects the moved widget
+            self._schedule_refresh(widget_list=True)
+
+    def _swap_layers(self, i: int, j: int):
+        """Swap two widgets in the list along with their z-indexes"""
+        widgets = self.layout_manager.widgets
+        widgets[i], widgets[j] = widgets[j], widgets[i]
+        a, b = widgets[i], widgets[j]
+        if a.z_index != b.z_index:
+            a.z_index, b.z_index = b.z_index, a.z_index
+            a.mark_changed()
+            b.mark_changed()
+        else:
+            # A shared z-index cannot express the new order; renumber once
+            for index, widget in enumerate(widgets):
+                widget.z_index = index
+                widget.mark_changed()
+                self.layout_manager.note_z_index(widget)
 
     def _bring_to_front(self):
         """Bring selected widget to front"""
-        if self.selected_widget:
-            # Set highest z-index
-            max_z = max([w.z_index for w in self.layout_manager.widgets])
-            self.selected_widget.z_index = max_z + 1
-
-            # Re-sort widgets by z-index
-            self.layout_manager.widgets.sort(key=lambda w: w.z_index)
-
-            # Update z-index values
-            for i, widget in enumerate(self.layout_manager.widgets):
-                widget.z_index = i
-
-            self._update_canvas()
-            self._update_active_widgets_list()
+        widget = self.selected_widget
+        widgets = self.layout_manager.widgets
+        if widget and widgets[-1] is not widget:
+            self._commit_pending_edit()
+            # The list order is the z-order, so only the moved widget changes
+            widgets.remove(widget)
+            widget.z_index = self.layout_manager._max_z + 1
+            widget.mark_changed()
+            self.layout_manager.note_z_index(widget)
+            widgets.append(widget)
+            self._refresh_property_baseline()
+
+            self._schedule_refresh(widget_list=True)
 
     def _send_to_back(self):
         """Send selected widget to back"""
-        if self.selected_widget:
-            # Set lowest z-index
-            min_z = min([w.z_index for w in self.layout_manager.widgets])
-            self.selected_widget.z_index = min_z - 1
-
-            # Re-sort widgets by z-index
-            self.layout_manager.widgets.sort(key=lambda w: w.z_index)
-
-            # Update z-index values
-            for i, widget in enumerate(self.layout_manager.widgets):
-                widget.z_index = i
-
-            self._update_canvas()
-            self._update_active_widgets_list()
+        widget = self.selected_widget
+        widgets = self.layout_manager.widgets
+        if widget and widgets[0] is not widget:
+            self._commit_pending_edit()
+            # The list order is the z-order, so only the moved widget changes
+            widgets.remove(widget)
+            widget.z_index = self.layout_manager._min_z - 1
+            widget.mark_changed()
+            self.layout_manager.note_z_index(widget)
+            widgets.insert(0, widget)
+            self._refresh_property_baseline()
+
+            self._schedule_refresh(widget_list=True)
 
     def _duplicate_widget(self):
         """Duplicate selected widget"""
         if not self.selected_widget:
             return
 
-        # Save state for undo
-        layout_state = copy.deepcopy(self.layout_manager.to_dict())
-
-        widget_class = self.selected_widget.__class__
-
-        # Create new widget of same type
-        new_widget = widget_class()
-
-        # Copy properties
-        new_widget.properties = self.selected_widget.properties.copy()
+        new_widget = self.selected_widget.clone()
+        self._connect_weather(new_widget)
 
         # Offset position
         new_x = min(self.selected_widget.x + 10,
@@ -1056,26 +1420,26 @@ Features:
         self.layout_manager.add_widget(new_widget)
 
         # Save undo state
-        self.undo_manager.save_state("Duplicated widget", layout_state)
+        self._push_undo("Duplicated widget",
+                        AddPatch(new_widget, self.layout_manager.widgets.index(new_widget)))
 
         # Update display
-        self._update_canvas()
-        self._update_active_widgets_list()
+        self._schedule_refresh(widget_list=True)
 
     def _reset_layout(self):
         """Reset layout to default"""
         response = messagebox.askyesno("Reset Layout",
                                      "Are you sure you want to reset layout?")
         if response:
+            dropped = list(self.layout_manager.widgets)
             self.layout_manager.widgets.clear()
+            self._forget_history(dropped)
             self._setup_default_layout()
 
     def _setup_default_layout(self):
         """Setup default layout for backward compatibility"""
-        plugin_manager = get_plugin_manager()
-
         # Create clock widget
-        clock_widget = plugin_manager.create_widget("Clock")
+        clock_widget = self._create_widget("Clock")
         if clock_widget:
             clock_widget.update_interval = self.config.update_interval
             clock_widget.set_property('time_format', self.config.time_format)
@@ -1091,7 +1455,7 @@ Features:
 
         # Create weather widget if enabled
         if self.config.show_weather:
-            weather_widget = plugin_manager.create_widget("Weather")
+            weather_widget = self._create_widget("Weather")
             if weather_widget:
                 weather_widget.set_property('text_color', self.config.text_color)
 
@@ -1101,10 +1465,6 @@ Features:
                 weather_widget.set_position(weather_x, weather_y)
                 weather_widget.z_index = 1  # Place above clock if overlapping
 
-                # Connect weather service to widget
-                if hasattr(weather_widget, 'get_weather_data') and isinstance(weather_widget, WeatherWidget):
-                    weather_widget.get_weather_data = self.weather_service.get_weather
-
                 # Add to layout
                 self.layout_manager.add_widget(weather_widget)
 
@@ -1112,27 +1472,23 @@ Features:
         self.layout_manager.background_color = self.config.background_color
 
         # Update display
-        self._update_canvas()
-        self._update_active_widgets_list()
+        self._schedule_refresh(widget_list=True)
 
     def _load_layout(self, layout_config_path: str):
         """Load layout from configuration file"""
         try:
-            import json
             with open(layout_config_path, 'r') as f:
                 layout_data = json.load(f)
 
             self.layout_manager = LayoutManager.from_dict(layout_data)
+            self._forget_history()
 
             # Connect weather service to weather widgets
             for widget in self.layout_manager.widgets:
-                if widget.__class__.__name__ == 'WeatherWidget' or 'Weather' in widget.__class__.__name__:
-                    if hasattr(widget, 'get_weather_data') and isinstance(widget, WeatherWidget):
-                        widget.get_weather_data = self.weather_service.get_weather
+                self._connect_weather(widget)
 
             # Update display
-            self._update_canvas()
-            self._update_active_widgets_list()
+            self._schedule_refresh(widget_list=True)
 
             print(f"Loaded layout from {layout_config_path}")
         except Exception as e:
@@ -1145,20 +1501,19 @@ Features:
         """Create new layout"""
         if self.file_ops:
             if self.file_ops.new_layout():
+                dropped = list(self.layout_manager.widgets)
                 self.layout_manager.widgets.clear()
-                self._update_canvas()
-                self._update_active_widgets_list()
-                if self.property_panel:
-                    self.property_panel.set_widget(None)
+                self._forget_history(dropped)
+                self._schedule_refresh(widget_list=True)
 
     def _open_layout(self):
         """Open layout from file"""
         if self.file_ops:
             if self.file_ops.open_layout():
-                self._update_canvas()
-                self._update_active_widgets_list()
-                if self.property_panel:
-                    self.property_panel.set_widget(None)
+                self._forget_history()
+                for widget in self.layout_manager.widgets:
+                    self._connect_weather(widget)
+                self._schedule_refresh(widget_list=True)
 
     def _save_layout(self):
         """Save layout to file"""
@@ -1190,121 +1545,215 @@ Features:
     def _apply_to_device(self):
         """Apply layout to actual device"""
         if not self.pixoo:
-            messagebox.showwarning("No Device", "Please connect to a device first")
+            # The toolbar's Apply button is disabled while disconnected; this
+            # covers the shortcut and menu entry
+            self.update_status("Connect to a device before applying the layout")
+            return
+
+        # Concurrent applies would race on the Pixoo's frame buffer; apply the
+        # latest layout once the running push completes instead
+        if self._apply_busy:
+            self._apply_queued = True
             return
 
+        self._apply_busy = True
         self.update_status("Applying layout to device...")
 
-        def apply_task():
+        # Snapshot the layout on the Tk thread; the editor may keep changing
+        # it while the worker talks to the device
+        render_data = self.layout_manager.get_render_data()
+        pixoo = self.pixoo
+
+        def apply_task(render_data, pixoo):
             try:
-                # Get render data
-                render_data = self.layout_manager.get_render_data()
-
-                # Clear screen with background color
-                bg_color = render_data['background']['color']
-                if self.pixoo:
-                    try:
-                        self.pixoo.fill(bg_color)
-
-                        # Draw each widget
-                        for widget_data in render_data['widgets']:
-                            if widget_data['type'] == 'text':
-                                self.pixoo.draw_text(
-                                    widget_data['text'],
-                                    xy=(widget_data['x'], widget_data['y']),
-                                    rgb=widget_data['color']
-                                )
-                            # Future: Handle other render types
-
-                        # Push to device
-                        self.pixoo.push()
-                    except AttributeError as e:
-                        self.root.after(0, lambda: messagebox.showerror("Error", f"Device method not available: {e}"))
-                    except Exception as e:
-                        self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to apply layout: {e}"))
-
-                self.root.after(0, lambda: self.update_status("Layout applied successfully"))
-                self.root.after(0, lambda: messagebox.showinfo("Success", "Layout applied to device!"))
+                # Clear screen with background color; drawing fills pixoo's
+                # local buffer and push() is the only request
+                pixoo.fill(render_data['background']['color'])
+
+                # Draw each widget
+                for widget_data in render_data['widgets']:
+                    if widget_data['type'] == 'text':
+                        pixoo.draw_text(
+                            widget_data['text'],
+                            xy=(widget_data['x'], widget_data['y']),
+                            rgb=widget_data['color']
+                        )
+                    # Future: Handle other render types
 
+                # Push to device
+                pixoo.push()
+            except AttributeError as e:
+                error = f"Device method not available: {e}"
             except Exception as e:
-                error_msg = str(e)
-                self.root.after(0, lambda: self.update_status(f"Error: {error_msg}"))
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to apply layout: {error_msg}"))
+                error = f"Failed to apply layout: {e}"
+            else:
+                error = None
+
+            self.root.after(0, self._on_apply_finished, error)
 
-        import threading
-        threading.Thread(target=apply_task, daemon=True).start()
+        threading.Thread(target=apply_task, args=(render_data, pixoo), daemon=True).start()
+
+    def _on_apply_finished(self, error: Optional[str]):
+        """Report an apply on the Tk thread and start the one queued behind it"""
+        self._apply_busy = False
+        if error:
+            self._report_apply_error(error)
+        else:
+            self.update_status("Layout applied successfully")
+
+        if self._apply_queued:
+            self._apply_queued = False
+            self._apply_to_device()
+
+    def _report_apply_error(self, message: str):
+        """Show an apply error, without repeating the same popup in quick succession"""
+        self.update_status(f"Error: {message}")
+
+        now = time.monotonic()
+        last = self._last_error
+        self._last_error = (message, now)
+        if last is not None and last[0] == message and now - last[1] < self.ERROR_POPUP_DEBOUNCE_SECONDS:
+            return
+        messagebox.showerror("Error", message)
 
     def _preview_layout(self):
         """Preview layout on screen"""
-        self._update_canvas()
+        self._schedule_refresh()
 
     def _undo(self):
         """Menu command for undo"""
+        self._pending_edit = None
         operation = self.undo_manager.undo()
         if operation and operation['state']:
-            # Restore the layout state
-            self.layout_manager = LayoutManager.from_dict(operation['state'])
-
-            # Update display
-            self._update_canvas()
-            self._update_active_widgets_list()
-            if self.property_panel:
-                self.property_panel.set_widget(None)
-
-            # Update toolbar state
-            self._update_toolbar_state()
+            # Revert the change in place
+            patch = operation['state'].invert()
+            patch.apply(self.layout_manager)
+            self._after_history_change(patch)
 
     def _redo(self):
         """Menu command for redo"""
         operation = self.undo_manager.redo()
         if operation and operation['state']:
-            # Restore the layout state
-            self.layout_manager = LayoutManager.from_dict(operation['state'])
+            # Reapply the change in place
+            operation['state'].apply(self.layout_manager)
+            self._after_history_change(operation['state'])
 
-            # Update display
-            self._update_canvas()
-            self._update_active_widgets_list()
-            if self.property_panel:
-                self.property_panel.set_widget(None)
+    def _forget_history(self, dropped=()):
+        """
+        Drop undo history and selection when the layout is replaced wholesale
 
-    def _update_active_widgets_list(self):
-        """Update the active widgets list"""
-        self.widget_listbox.delete(0, tk.END)
+        Args:
+            dropped: Widgets taken out of the layout by the replacement
+        """
+        # Removed widgets live on only in the history; once it is cleared
+        # they can be recycled along with the dropped ones
+        orphans = {id(widget): widget for widget in dropped}
+        for operation in self.undo_manager.undo_stack + self.undo_manager.redo_stack:
+            widget = getattr(operation['state'], 'widget', None)
+            if widget is not None:
+                orphans[id(widget)] = widget
+        for widget in self.layout_manager.widgets:
+            orphans.pop(id(widget), None)
+
+        # Undo patches hold widget objects, so they cannot span a layout swap
+        self.undo_manager.clear()
+        self._pending_edit = None
+        self.selected_widget = None
+        self._show_properties(None)
+        self._recycle_widgets(orphans.values())
+
+    def _after_history_change(self, patch: UndoPatch):
+        """Refresh the UI after an undo or redo applied a patch in place"""
+        # Widgets are patched in place, so the selection survives unless the
+        # patch took it out of the layout
+        selected = self.selected_widget
+        if selected is not None:
+            if not any(widget is selected for widget in self.layout_manager.widgets):
+                self.selected_widget = None
+                self._show_properties(None)
+            elif patch.widget is selected:
+                # Reload the panel with the values the patch restored
+                self._update_selected_extents()
+                self._show_properties(selected)
+
+        # Update display
+        self._schedule_refresh(widget_list=True)
 
+        # Update toolbar state
+        self._update_toolbar_state()
+
+    def _update_active_widgets_list(self):
+        """Update the active widgets list, touching only rows that changed"""
+        entries = []
         for widget in self.layout_manager.widgets:
             widget_type = widget.__class__.__name__.replace("Widget", "")
             position = f"({widget.x}, {widget.y})"
-            self.widget_listbox.insert(tk.END, f"{widget_type} {position}")
+            entries.append(f"{widget_type} {position}")
+
+        listbox = self.widget_listbox
+        previous = self._listbox_entries
+        if entries != previous:
+            listbox.selection_clear(0, tk.END)
+
+            # Apply the edits back to front so earlier indices stay valid; an
+            # insert or removal costs one call instead of rewriting every row after it
+            opcodes = SequenceMatcher(None, previous, entries, autojunk=False).get_opcodes()
+            for tag, i1, i2, j1, j2 in reversed(opcodes):
+                if tag == 'equal':
+                    continue
+                if i2 > i1:
+                    listbox.delete(i1, i2 - 1)
+                if j2 > j1:
+                    listbox.insert(i1, *entries[j1:j2])
+
+            self._listbox_entries = entries
+        self._listbox_to_widget = list(self.layout_manager.widgets)
+
+        # Keep the selected widget highlighted, since refreshes run deferred
+        self._select_widget_in_list(self.selected_widget)
+
+    def _get_list_widget(self):
+        """Get the widget behind the selected listbox row, if any"""
+        selection = self.widget_listbox.curselection()
+        if selection and selection[0] < len(self._listbox_to_widget):
+            return self._listbox_to_widget[selection[0]]
+        return None
 
     def _get_selected_widget_index(self) -> Optional[int]:
-        """Get selected widget index from the listbox"""
-        selection = self.widget_listbox.curselection()
-        if selection:
-            return selection[0]
+        """Get the selected widget's index in the layout's z-ordered list"""
+        selected = self.selected_widget
+        if selected is not None:
+            for index, widget in enumerate(self.layout_manager.widgets):
+                if widget is selected:
+                    return index
         return None
 
     def _on_widget_list_select(self, event):
         """Handle widget selection from the list"""
-        index = self._get_selected_widget_index()
-        if index is not None and 0 <= index < len(self.layout_manager.widgets):
-            widget = self.layout_manager.widgets[index]
+        # Rows map to widgets by identity, so a pending reorder cannot
+        # make a row pick the wrong widget
+        widget = self._get_list_widget()
+        if widget is not None:
             self.selected_widget = widget
-            if self.property_panel:
-                self.property_panel.set_widget(widget)
-            self._update_canvas()
-
-    def _select_widget_in_list(self, index: int):
-        """Select widget at index in the listbox"""
-        self.widget_listbox.selection_clear(0, tk.END)
-        if 0 <= index < self.widget_listbox.size():
-            self.widget_listbox.selection_set(index)
-            self.widget_listbox.see(index)
+            self._show_properties(widget)
+            self._schedule_refresh()
+
+    def _select_widget_in_list(self, widget):
+        """Select the listbox row showing a widget, or clear the selection"""
+        row = next((i for i, shown in enumerate(self._listbox_to_widget) if shown is widget), None)
+        listbox = self.widget_listbox
+        if row is None:
+            listbox.selection_clear(0, tk.END)
+        elif listbox.curselection() != (row,):
+            listbox.selection_clear(0, tk.END)
+            listbox.selection_set(row)
+            listbox.see(row)
 
     def _remove_widget_from_list(self):
         """Remove widget selected in the list"""
-        index = self._get_selected_widget_index()
-        if index is not None and 0 <= index < len(self.layout_manager.widgets):
-            self.selected_widget = self.layout_manager.widgets[index]
+        widget = self._get_list_widget()
+        if widget is not None and any(w is widget for w in self.layout_manager.widgets):
+            self.selected_widget = widget
             self._remove_widget()
 
     def _move_widget_up_in_list(self):
@@ -1,10 +1,73 @@
 """
 Property panel for editing widget properties in the GUI
 """
+import re
 import tkinter as tk
+from functools import partial
 from tkinter import ttk
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from widgets.base_widget import BaseWidget
+from widgets.plugins.clock_widget import ClockWidget
+from widgets.plugins.weather_widget import WeatherWidget
+
+
+def _to_int(value) -> int:
+    """Integer editor value, 0 when unset"""
+    return int(value) if value is not None else 0
+
+
+def _format_rgb(value) -> str:
+    """Text for an R,G,B color entry"""
+    if isinstance(value, (list, tuple)):
+        return f"{value[0]},{value[1]},{value[2]}"
+    return "255,255,255"
+
+
+# "R,G,B" as typed into a color entry
+_RGB_RE = re.compile(r'^\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*$')
+
+
+def _parse_rgb(text: str) -> Optional[Tuple[int, int, int]]:
+    """Parse an R,G,B color entry, clamping channels to 255; None if malformed"""
+    match = _RGB_RE.match(text)
+    if match is None:
+        return None
+    return tuple(min(255, int(channel)) for channel in match.groups())
+
+
+# Grid columns used by the property editors
+_COLUMNS = 6
+
+# Property schemas are class-level constants, so they are fetched once per class
+_SCHEMA_CACHE: Dict[type, Optional[Dict[str, Any]]] = {}
+# Widget class -> panel title
+_TITLE_CACHE: Dict[type, str] = {}
+
+
+def _widget_schema(widget: BaseWidget) -> Optional[Dict[str, Any]]:
+    """Property schema of a widget's class, or None if it has none"""
+    cls = widget.__class__
+    if cls not in _SCHEMA_CACHE:
+        get_schema = getattr(cls, 'get_property_schema', None)
+        _SCHEMA_CACHE[cls] = get_schema(widget) if get_schema else None
+    return _SCHEMA_CACHE[cls]
+
+
+def _panel_title(cls: type) -> str:
+    """Panel title for a widget class"""
+    title = _TITLE_CACHE.get(cls)
+    if title is None:
+        title = _TITLE_CACHE[cls] = f"{cls.__name__.replace('Widget', '')} Properties"
+    return title
+
+
+def _schema_reader(name: str, default: Any, convert: Callable[[Any], Any]) -> Callable[[BaseWidget], Any]:
+    """Reader showing a schema property, falling back to its default"""
+    def read(widget):
+        value = widget.get_property(name)
+        return convert(default if value is None else value)
+    return read
 
 
 class PropertyPanel:
@@ -22,6 +85,24 @@ class PropertyPanel:
         self.on_property_changed = on_property_changed
         self.current_widget = None
 
+        # Editors are rebuilt only when the widget class changes;
+        # otherwise their variables are reloaded from the new widget
+        self._built_for: Optional[type] = None
+        self._vars: Dict[str, tk.Variable] = {}
+        self._readers: Dict[str, Callable[[BaseWidget], Any]] = {}
+        self._loading = False  # True while variables are reloaded
+
+        # Variable writes are coalesced into one commit per event-loop turn
+        self._appliers: List[Callable[[BaseWidget], None]] = []
+        self._pending = False
+
+        self._row = 0  # Next free grid row in property_frame
+
+        # Editors for widgets without a property schema, checked in order
+        self._type_builders: List[Tuple[type, Callable[[BaseWidget], None]]] = []
+        self.register(ClockWidget, self._create_clock_properties)
+        self.register(WeatherWidget, self._create_weather_properties)
+
         # Create main frame
         self.frame = ttk.Frame(parent)
         self._setup_ui()
@@ -33,15 +114,28 @@ class PropertyPanel:
         self.title_label.pack(anchor=tk.W, pady=(0, 10))
 
         # Property container
+        # Editors share one grid: label/entry pairs in columns 0-5
         self.property_frame = ttk.Frame(self.frame)
         self.property_frame.pack(fill=tk.BOTH, expand=True)
+        self.property_frame.columnconfigure(1, weight=1)
+        self.property_frame.columnconfigure(3, weight=1)
 
         # Initial empty message
         self.empty_label = ttk.Label(
             self.property_frame,
             text="Select a widget to edit its properties"
         )
-        self.empty_label.pack(pady=20)
+        self.empty_label.grid(row=0, column=0, columnspan=_COLUMNS, pady=20)
+
+    def register(self, cls: type, builder: Callable[[BaseWidget], None]):
+        """
+        Register the editor builder for a widget type without a property schema
+
+        Args:
+            cls: Widget class; subclasses are matched too
+            builder: Creates the editors for a widget of that class
+        """
+        self._type_builders.append((cls, builder))
 
     def set_widget(self, widget: BaseWidget = None):
         """
@@ -50,408 +144,451 @@ class PropertyPanel:
         Args:
             widget: Widget to edit or None to clear
         """
+        if self._pending:
+            self._commit()
         self.current_widget = widget
 
-        # Clear current properties
-        for child in self.property_frame.winfo_children():
-            child.destroy()
-
         if not widget:
+            # Hide the editors but keep them for the next widget of the same class
             self.title_label.config(text="No Widget Selected")
-            self.empty_label = ttk.Label(
-                self.property_frame,
-                text="Select a widget to edit its properties"
-            )
-            self.empty_label.pack(pady=20)
+            for child in self.property_frame.winfo_children():
+                if child is not self.empty_label:
+                    child.grid_remove()
+            self.empty_label.grid()
+            return
+
+        layout = widget.__class__
+        if layout is self._built_for:
+            # Same editors as before; just show this widget's values
+            if self.empty_label.winfo_manager():
+                self.empty_label.grid_remove()
+                for child in self.property_frame.winfo_children():
+                    if child is not self.empty_label:
+                        child.grid()
+            self._load_values(widget)
             return
 
+        # Clear current properties
+        for child in self.property_frame.winfo_children():
+            if child is not self.empty_label:
+                child.destroy()
+        self.empty_label.grid_remove()
+        self._vars.clear()
+        self._readers.clear()
+        self._appliers.clear()
+        self._built_for = layout
+        self._row = 0
+
         # Set title
-        widget_type = widget.__class__.__name__.replace("Widget", "")
-        self.title_label.config(text=f"{widget_type} Properties")
+        self.title_label.config(text=_panel_title(layout))
 
         # Create specific property editors based on widget type
-        if hasattr(widget, 'get_property_schema'):
-            self._create_dynamic_properties(widget)
-        elif widget.__class__.__name__ == 'ClockWidget' or 'Clock' in widget.__class__.__name__:
-            self._create_clock_properties(widget)
-        elif widget.__class__.__name__ == 'WeatherWidget' or 'Weather' in widget.__class__.__name__:
-            self._create_weather_properties(widget)
-        else:
-            self._create_base_properties(widget)
+        schema = _widget_schema(widget)
+        if schema is not None:
+            self._create_dynamic_properties(widget, schema)
+            return
+
+        for cls, builder in self._type_builders:
+            if isinstance(widget, cls):
+                builder(widget)
+                return
+        self._create_base_properties(widget)
+
+    def _bind_var(self, name: str, var: tk.Variable, reader: Callable[[BaseWidget], Any]):
+        """
+        Register an editor variable so it can be reloaded for another widget
+
+        Args:
+            name: Editor name, unique within the panel
+            var: Variable shown by the editor
+            reader: Returns the value to show for a widget
+        """
+        self._vars[name] = var
+        self._readers[name] = reader
+
+    def _bind_color_vars(self, name: str, channel_vars: Tuple[tk.Variable, ...]):
+        """Register the R, G and B variables of a color editor"""
+        for i, (channel, var) in enumerate(zip('rgb', channel_vars)):
+            self._bind_var(f"{name}.{channel}", var,
+                           lambda w, i=i: w.get_property(name, (255, 255, 255))[i])
+
+    def _schedule_commit(self, *args):
+        """Queue a single commit for the current burst of variable writes"""
+        if self._loading or self._pending:
+            return
+        self._pending = True
+        self.frame.after_idle(self._commit)
+
+    def _commit(self):
+        """Write the traced editor values to the current widget"""
+        if not self._pending:
+            return
+        self._pending = False
+        widget = self.current_widget
+        if not widget:
+            return
 
-    def _create_dynamic_properties(self, widget):
+        try:
+            for apply in self._appliers:
+                apply(widget)
+        except tk.TclError:
+            # An entry holds a partial value (e.g. empty while typing)
+            return
+
+        if self.on_property_changed:
+            self.on_property_changed(widget)
+
+    def _load_values(self, widget: BaseWidget):
+        """Show a widget's values in the existing editors without committing them"""
+        self.title_label.config(text=_panel_title(widget.__class__))
+
+        self._loading = True
+        try:
+            for name, var in self._vars.items():
+                var.set(self._readers[name](widget))
+        finally:
+            self._loading = False
+
+    def _next_row(self) -> int:
+        """Claim the next grid row of the property frame"""
+        row = self._row
+        self._row += 1
+        return row
+
+    def _grid_label(self, text: str, **options) -> ttk.Label:
+        """Add a label spanning a full grid row"""
+        pady = options.pop('pady', (0, 5))
+        label = ttk.Label(self.property_frame, text=text, **options)
+        label.grid(row=self._next_row(), column=0, columnspan=_COLUMNS, sticky='w', pady=pady)
+        return label
+
+    def _grid_separator(self):
+        """Add a horizontal separator spanning a full grid row"""
+        ttk.Separator(self.property_frame, orient=tk.HORIZONTAL).grid(
+            row=self._next_row(), column=0, columnspan=_COLUMNS, sticky='ew', pady=10)
+
+    def _grid_rgb(self, row: int, channel_vars: Tuple[tk.Variable, ...]):
+        """Place R, G and B spinboxes side by side on one grid row"""
+        for i, (text, var) in enumerate(zip(("R:", "G:", "B:"), channel_vars)):
+            ttk.Label(self.property_frame, text=text).grid(row=row, column=2 * i, sticky='w')
+            ttk.Spinbox(self.property_frame, from_=0, to=255, textvariable=var, width=5).grid(
+                row=row, column=2 * i + 1, sticky='w', padx=5)
+
+    def _create_dynamic_properties(self, widget, schema: Dict[str, Any]):
         """Create property editors based on widget schema"""
         # First create base properties (position, size, etc.)
         self._create_base_properties(widget)
 
-        # Separator
-        ttk.Separator(self.property_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
-        ttk.Label(self.property_frame, text="Widget Settings", font=('Arial', 9, 'bold')).pack(anchor=tk.W, pady=(0, 10))
-
-        schema = widget.get_property_schema()
+        self._grid_separator()
+        self._grid_label("Widget Settings", font=('Arial', 9, 'bold'), pady=(0, 10))
 
         for prop_name, prop_info in schema.items():
             label_text = prop_info.get('label', prop_name.capitalize())
             prop_type = prop_info.get('type', 'string')
-            description = prop_info.get('description', '')
 
-            # Container for this property
-            frame = ttk.Frame(self.property_frame)
-            frame.pack(fill=tk.X, pady=5)
-
-            ttk.Label(frame, text=f"{label_text}:").pack(anchor=tk.W)
+            self._grid_label(f"{label_text}:", pady=(5, 0))
 
             current_value = widget.get_property(prop_name)
             if current_value is None:
                 current_value = prop_info.get('default')
 
-            if prop_type == 'string':
-                var = tk.StringVar(value=str(current_value))
-                entry = ttk.Entry(frame, textvariable=var)
-                entry.pack(fill=tk.X, pady=(2, 0))
-
-                def on_string_change(name=prop_name, v=var):
-                    widget.set_property(name, v.get())
-                    if self.on_property_changed:
-                        self.on_property_changed(widget)
-
-                entry.bind('<FocusOut>', lambda e, n=prop_name, v=var: on_string_change(n, v))
-                entry.bind('<Return>', lambda e, n=prop_name, v=var: on_string_change(n, v))
-
-            elif prop_type == 'integer':
-                var = tk.IntVar(value=int(current_value) if current_value is not None else 0)
-
-                min_val = prop_info.get('min', -9999)
-                max_val = prop_info.get('max', 9999)
-
-                spin = ttk.Spinbox(frame, from_=min_val, to=max_val, textvariable=var)
-                spin.pack(fill=tk.X, pady=(2, 0))
-
-                def on_int_change(name=prop_name, v=var):
-                    try:
-                        widget.set_property(name, v.get())
-                        if self.on_property_changed:
-                            self.on_property_changed(widget)
-                    except:
-                        pass
-
-                spin.bind('<FocusOut>', lambda e, n=prop_name, v=var: on_int_change(n, v))
-                spin.bind('<Return>', lambda e, n=prop_name, v=var: on_int_change(n, v))
-                spin.config(command=lambda n=prop_name, v=var: on_int_change(n, v))
-
-            elif prop_type == 'boolean':
-                var = tk.BooleanVar(value=bool(current_value))
-                check = ttk.Checkbutton(frame, text=description or label_text, variable=var)
-                check.pack(anchor=tk.W)
-
-                def on_bool_change(name=prop_name, v=var):
-                    widget.set_property(name, v.get())
-                    if self.on_property_changed:
-                        self.on_property_changed(widget)
-
-                check.config(command=lambda n=prop_name, v=var: on_bool_change(n, v))
-
-            elif prop_type == 'color':
-                # Simple color entry for now (R,G,B)
-                if isinstance(current_value, (list, tuple)):
-                    color_str = f"{current_value[0]},{current_value[1]},{current_value[2]}"
-                else:
-                    color_str = "255,255,255"
-
-                var = tk.StringVar(value=color_str)
-                entry = ttk.Entry(frame, textvariable=var)
-                entry.pack(fill=tk.X, pady=(2, 0))
-                ttk.Label(frame, text="Format: R,G,B (e.g. 255,0,0)", font=('Arial', 8)).pack(anchor=tk.W)
-
-                def on_color_change(name=prop_name, v=var):
-                    try:
-                        parts = [int(x.strip()) for x in v.get().split(',')]
-                        if len(parts) == 3:
-                            widget.set_property(name, tuple(parts))
-                            if self.on_property_changed:
-                                self.on_property_changed(widget)
-                    except:
-                        pass
-
-                entry.bind('<FocusOut>', lambda e, n=prop_name, v=var: on_color_change(n, v))
-                entry.bind('<Return>', lambda e, n=prop_name, v=var: on_color_change(n, v))
+            builder = self._BUILDERS.get(prop_type, self._BUILDERS['string'])
+            builder(self, prop_name, prop_info, current_value)
+
+    def _build_string_prop(self, name: str, info: Dict[str, Any], value) -> tk.Variable:
+        """Build a text entry for a string property"""
+        var = tk.StringVar(value=str(value))
+        self._bind_var(name, var, _schema_reader(name, info.get('default'), str))
+        entry = ttk.Entry(self.property_frame, textvariable=var)
+        entry.grid(row=self._next_row(), column=0, columnspan=_COLUMNS, sticky='ew', pady=(2, 0))
+        self._bind_entry_commit(entry, name, var, 'string')
+        return var
+
+    def _build_int_prop(self, name: str, info: Dict[str, Any], value) -> tk.Variable:
+        """Build a spinbox for an integer property"""
+        var = tk.IntVar(value=_to_int(value))
+        self._bind_var(name, var, _schema_reader(name, info.get('default'), _to_int))
+        spin = ttk.Spinbox(self.property_frame, from_=info.get('min', -9999), to=info.get('max', 9999),
+                           textvariable=var, command=partial(self._commit_property, name, var, 'integer'))
+        spin.grid(row=self._next_row(), column=0, columnspan=_COLUMNS, sticky='ew', pady=(2, 0))
+        self._bind_entry_commit(spin, name, var, 'integer')
+        return var
+
+    def _build_bool_prop(self, name: str, info: Dict[str, Any], value) -> tk.Variable:
+        """Build a checkbutton for a boolean property"""
+        var = tk.BooleanVar(value=bool(value))
+        self._bind_var(name, var, _schema_reader(name, info.get('default'), bool))
+        text = info.get('description') or info.get('label', name.capitalize())
+        check = ttk.Checkbutton(self.property_frame, text=text, variable=var,
+                                command=partial(self._commit_property, name, var, 'boolean'))
+        check.grid(row=self._next_row(), column=0, columnspan=_COLUMNS, sticky='w')
+        return var
+
+    def _build_color_prop(self, name: str, info: Dict[str, Any], value) -> tk.Variable:
+        """Build an R,G,B text entry for a color property"""
+        var = tk.StringVar(value=_format_rgb(value))
+        self._bind_var(name, var, _schema_reader(name, info.get('default'), _format_rgb))
+        entry = ttk.Entry(self.property_frame, textvariable=var)
+        entry.grid(row=self._next_row(), column=0, columnspan=_COLUMNS, sticky='ew', pady=(2, 0))
+        self._grid_label("Format: R,G,B (e.g. 255,0,0)", font=('Arial', 8), pady=0)
+        self._bind_entry_commit(entry, name, var, 'color')
+        return var
+
+    # Schema property type -> editor builder; unknown types get a text entry
+    _BUILDERS = {
+        'string': _build_string_prop,
+        'integer': _build_int_prop,
+        'boolean': _build_bool_prop,
+        'color': _build_color_prop,
+    }
+
+    def _bind_entry_commit(self, entry, name: str, var: tk.Variable, kind: str):
+        """Commit an entry's value on focus loss or Return"""
+        entry._prop_meta = (name, var, kind)
+        entry.bind('<FocusOut>', self._on_entry_commit)
+        entry.bind('<Return>', self._on_entry_commit)
+
+    def _on_entry_commit(self, event):
+        """Shared FocusOut/Return handler for schema property entries"""
+        self._commit_property(*event.widget._prop_meta)
+
+    def _commit_property(self, name: str, var: tk.Variable, kind: str):
+        """
+        Write a schema property editor's value to the current widget
+
+        Args:
+            name: Property name
+            var: Variable holding the edited value
+            kind: Schema type of the property
+        """
+        widget = self.current_widget
+        if not widget:
+            return
+
+        if kind == 'color':
+            value = _parse_rgb(var.get())
+            if value is None:
+                return
+        else:
+            try:
+                value = var.get()
+            except tk.TclError:
+                # Partial number in a spinbox
+                return
+
+        widget.set_property(name, value)
+        if self.on_property_changed:
+            self.on_property_changed(widget)
 
     def _create_base_properties(self, widget: BaseWidget):
         """Create property editors for base widget properties"""
-        # Position
-        ttk.Label(self.property_frame, text="Position:").pack(anchor=tk.W, pady=(10, 5))
-
-        pos_frame = ttk.Frame(self.property_frame)
-        pos_frame.pack(fill=tk.X, pady=(0, 10))
+        frame = self.property_frame
 
-        ttk.Label(pos_frame, text="X:").pack(side=tk.LEFT)
+        # Position
+        self._grid_label("Position:", pady=(10, 5))
+        row = self._next_row()
+        ttk.Label(frame, text="X:").grid(row=row, column=0, sticky='w')
         x_var = tk.IntVar(value=widget.x)
-        x_entry = ttk.Entry(pos_frame, textvariable=x_var, width=10)
-        x_entry.pack(side=tk.LEFT, padx=(5, 10))
-
-        ttk.Label(pos_frame, text="Y:").pack(side=tk.LEFT)
+        ttk.Entry(frame, textvariable=x_var, width=10).grid(row=row, column=1, sticky='ew', padx=(5, 10))
+        ttk.Label(frame, text="Y:").grid(row=row, column=2, sticky='w')
         y_var = tk.IntVar(value=widget.y)
-        y_entry = ttk.Entry(pos_frame, textvariable=y_var, width=10)
-        y_entry.pack(side=tk.LEFT, padx=5)
+        ttk.Entry(frame, textvariable=y_var, width=10).grid(row=row, column=3, sticky='ew', padx=5)
 
         # Size
-        ttk.Label(self.property_frame, text="Size:").pack(anchor=tk.W, pady=(0, 5))
-
-        size_frame = ttk.Frame(self.property_frame)
-        size_frame.pack(fill=tk.X, pady=(0, 10))
-
-        ttk.Label(size_frame, text="Width:").pack(side=tk.LEFT)
+        self._grid_label("Size:", pady=(10, 5))
+        row = self._next_row()
+        ttk.Label(frame, text="Width:").grid(row=row, column=0, sticky='w')
         width_var = tk.IntVar(value=widget.width)
-        width_entry = ttk.Entry(size_frame, textvariable=width_var, width=10)
-        width_entry.pack(side=tk.LEFT, padx=(5, 10))
-
-        ttk.Label(size_frame, text="Height:").pack(side=tk.LEFT)
+        ttk.Entry(frame, textvariable=width_var, width=10).grid(row=row, column=1, sticky='ew', padx=(5, 10))
+        ttk.Label(frame, text="Height:").grid(row=row, column=2, sticky='w')
         height_var = tk.IntVar(value=widget.height)
-        height_entry = ttk.Entry(size_frame, textvariable=height_var, width=10)
-        height_entry.pack(side=tk.LEFT, padx=5)
+        ttk.Entry(frame, textvariable=height_var, width=10).grid(row=row, column=3, sticky='ew', padx=5)
 
         # Z-index
-        ttk.Label(self.property_frame, text="Z-Index:").pack(anchor=tk.W, pady=(0, 5))
+        self._grid_label("Z-Index:", pady=(10, 5))
         z_var = tk.IntVar(value=widget.z_index)
         z_spinbox = ttk.Spinbox(
-            self.property_frame,
+            frame,
             from_=0,
             to=99,
             textvariable=z_var,
             width=10
         )
-        z_spinbox.pack(anchor=tk.W, pady=(0, 10))
+        z_spinbox.grid(row=self._next_row(), column=0, columnspan=2, sticky='w')
 
         # Update interval
-        ttk.Label(self.property_frame, text="Update Interval (seconds):").pack(anchor=tk.W, pady=(0, 5))
+        self._grid_label("Update Interval (seconds):", pady=(10, 5))
         interval_var = tk.IntVar(value=widget.update_interval)
-        interval_entry = ttk.Entry(self.property_frame, textvariable=interval_var, width=10)
-        interval_entry.pack(anchor=tk.W, pady=(0, 10))
+        interval_entry = ttk.Entry(frame, textvariable=interval_var, width=10)
+        interval_entry.grid(row=self._next_row(), column=0, columnspan=2, sticky='w')
 
         # Visible checkbox
         visible_var = tk.BooleanVar(value=widget.visible)
         visible_check = ttk.Checkbutton(
-            self.property_frame,
+            frame,
             text="Visible",
             variable=visible_var
         )
-        visible_check.pack(anchor=tk.W, pady=(0, 10))
+        visible_check.grid(row=self._next_row(), column=0, columnspan=_COLUMNS, sticky='w', pady=10)
+
+        for name, var in (('x', x_var), ('y', y_var), ('width', width_var),
+                          ('height', height_var), ('z_index', z_var),
+                          ('update_interval', interval_var), ('visible', visible_var)):
+            self._bind_var(name, var, lambda w, n=name: getattr(w, n))
 
         # Bind change events
-        def on_change():
+        def apply_base(widget):
             widget.set_position(x_var.get(), y_var.get())
             widget.set_size(width_var.get(), height_var.get())
             widget.z_index = z_var.get()
             widget.update_interval = interval_var.get()
             widget.visible = visible_var.get()
+            widget.mark_changed()
 
-            if self.on_property_changed:
-                self.on_property_changed(widget)
-
-        x_var.trace('w', lambda *args: on_change())
-        y_var.trace('w', lambda *args: on_change())
-        width_var.trace('w', lambda *args: on_change())
-        height_var.trace('w', lambda *args: on_change())
-        z_var.trace('w', lambda *args: on_change())
-        interval_var.trace('w', lambda *args: on_change())
-        visible_var.trace('w', lambda *args: on_change())
+        self._appliers.append(apply_base)
+        for var in (x_var, y_var, width_var, height_var, z_var, interval_var, visible_var):
+            var.trace_add('write', self._schedule_commit)
 
     def _create_clock_properties(self, widget: BaseWidget):
         """Create property editors specific to ClockWidget"""
         self._create_base_properties(widget)
+        frame = self.property_frame
 
-        # Separator
-        ttk.Separator(self.property_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
+        self._grid_separator()
 
         # Clock-specific properties
-        ttk.Label(self.property_frame, text="Clock Settings:").pack(anchor=tk.W, pady=(0, 10))
+        self._grid_label("Clock Settings:", pady=(0, 10))
 
         # Time format
         time_format = widget.get_property('time_format', '24')
         time_format_var = tk.StringVar(value=time_format)
+        self._bind_var('time_format', time_format_var, lambda w: w.get_property('time_format', '24'))
 
-        time_frame = ttk.Frame(self.property_frame)
-        time_frame.pack(fill=tk.X, pady=(0, 10))
-
-        ttk.Label(time_frame, text="Format:").pack(side=tk.LEFT)
-
-        format_frame = ttk.Frame(time_frame)
-        format_frame.pack(side=tk.LEFT, padx=5)
-
+        row = self._next_row()
+        ttk.Label(frame, text="Format:").grid(row=row, column=0, sticky='w')
         ttk.Radiobutton(
-            format_frame,
+            frame,
             text="24-hour",
             variable=time_format_var,
             value="24"
-        ).pack(side=tk.LEFT)
-
+        ).grid(row=row, column=1, sticky='w', padx=5)
         ttk.Radiobutton(
-            format_frame,
+            frame,
             text="12-hour",
             variable=time_format_var,
             value="12"
-        ).pack(side=tk.LEFT, padx=(10, 0))
+        ).grid(row=row, column=2, columnspan=2, sticky='w', padx=(10, 0))
 
         # Show seconds
         show_seconds = widget.get_property('show_seconds', False)
         show_seconds_var = tk.BooleanVar(value=show_seconds)
+        self._bind_var('show_seconds', show_seconds_var, lambda w: w.get_property('show_seconds', False))
         show_seconds_check = ttk.Checkbutton(
-            self.property_frame,
+            frame,
             text="Show Seconds",
             variable=show_seconds_var
         )
-        show_seconds_check.pack(anchor=tk.W, pady=(0, 10))
+        show_seconds_check.grid(row=self._next_row(), column=0, columnspan=_COLUMNS, sticky='w', pady=10)
 
         # Font size
         font_size = widget.get_property('font_size', 4)
         font_size_var = tk.IntVar(value=font_size)
+        self._bind_var('font_size', font_size_var, lambda w: w.get_property('font_size', 4))
 
-        font_frame = ttk.Frame(self.property_frame)
-        font_frame.pack(fill=tk.X, pady=(0, 10))
-
-        ttk.Label(font_frame, text="Font Size:").pack(side=tk.LEFT)
+        row = self._next_row()
+        ttk.Label(frame, text="Font Size:").grid(row=row, column=0, sticky='w')
         font_spinbox = ttk.Spinbox(
-            font_frame,
+            frame,
             from_=2,
             to=8,
             textvariable=font_size_var,
             width=10
         )
-        font_spinbox.pack(side=tk.LEFT, padx=5)
+        font_spinbox.grid(row=row, column=1, sticky='w', padx=5)
 
         # Text color
         text_color = widget.get_property('text_color', (255, 255, 255))
-        color_frame = ttk.Frame(self.property_frame)
-        color_frame.pack(fill=tk.X, pady=(0, 10))
-
-        ttk.Label(color_frame, text="Text Color:").pack(anchor=tk.W, pady=(0, 5))
-
-        rgb_frame = ttk.Frame(color_frame)
-        rgb_frame.pack(fill=tk.X)
+        self._grid_label("Text Color:", pady=(10, 5))
 
         r_var = tk.IntVar(value=text_color[0])
         g_var = tk.IntVar(value=text_color[1])
         b_var = tk.IntVar(value=text_color[2])
-
-        ttk.Label(rgb_frame, text="R:").pack(side=tk.LEFT)
-        r_spinbox = ttk.Spinbox(rgb_frame, from_=0, to=255, textvariable=r_var, width=5)
-        r_spinbox.pack(side=tk.LEFT, padx=(5, 10))
-
-        ttk.Label(rgb_frame, text="G:").pack(side=tk.LEFT)
-        g_spinbox = ttk.Spinbox(rgb_frame, from_=0, to=255, textvariable=g_var, width=5)
-        g_spinbox.pack(side=tk.LEFT, padx=5)
-
-        ttk.Label(rgb_frame, text="B:").pack(side=tk.LEFT)
-        b_spinbox = ttk.Spinbox(rgb_frame, from_=0, to=255, textvariable=b_var, width=5)
-        b_spinbox.pack(side=tk.LEFT, padx=5)
+        self._bind_color_vars('text_color', (r_var, g_var, b_var))
+        self._grid_rgb(self._next_row(), (r_var, g_var, b_var))
 
         # Bind change events
-        def on_clock_change():
+        def apply_clock(widget):
             widget.set_property('time_format', time_format_var.get())
             widget.set_property('show_seconds', show_seconds_var.get())
             widget.set_property('font_size', font_size_var.get())
             widget.set_property('text_color', (r_var.get(), g_var.get(), b_var.get()))
 
-            if self.on_property_changed:
-                self.on_property_changed(widget)
-
-        time_format_var.trace('w', lambda *args: on_clock_change())
-        show_seconds_var.trace('w', lambda *args: on_clock_change())
-        font_size_var.trace('w', lambda *args: on_clock_change())
-        r_var.trace('w', lambda *args: on_clock_change())
-        g_var.trace('w', lambda *args: on_clock_change())
-        b_var.trace('w', lambda *args: on_clock_change())
+        self._appliers.append(apply_clock)
+        for var in (time_format_var, show_seconds_var, font_size_var, r_var, g_var, b_var):
+            var.trace_add('write', self._schedule_commit)
 
     def _create_weather_properties(self, widget: BaseWidget):
         """Create property editors specific to WeatherWidget"""
         self._create_base_properties(widget)
+        frame = self.property_frame
 
-        # Separator
-        ttk.Separator(self.property_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=10)
+        self._grid_separator()
 
         # Weather-specific properties
-        ttk.Label(self.property_frame, text="Weather Settings:").pack(anchor=tk.W, pady=(0, 10))
+        self._grid_label("Weather Settings:", pady=(0, 10))
 
         # Temperature unit
         temp_unit = widget.get_property('temperature_unit', 'C')
         temp_unit_var = tk.StringVar(value=temp_unit)
+        self._bind_var('temperature_unit', temp_unit_var, lambda w: w.get_property('temperature_unit', 'C'))
 
-        temp_frame = ttk.Frame(self.property_frame)
-        temp_frame.pack(fill=tk.X, pady=(0, 10))
-
-        ttk.Label(temp_frame, text="Temperature Unit:").pack(side=tk.LEFT)
-
-        unit_frame = ttk.Frame(temp_frame)
-        unit_frame.pack(side=tk.LEFT, padx=5)
-
+        row = self._next_row()
+        ttk.Label(frame, text="Temperature Unit:").grid(row=row, column=0, sticky='w')
         ttk.Radiobutton(
-            unit_frame,
+            frame,
             text="Celsius",
             variable=temp_unit_var,
             value="C"
-        ).pack(side=tk.LEFT)
-
+        ).grid(row=row, column=1, sticky='w', padx=5)
         ttk.Radiobutton(
-            unit_frame,
+            frame,
             text="Fahrenheit",
             variable=temp_unit_var,
             value="F"
-        ).pack(side=tk.LEFT, padx=(10, 0))
+        ).grid(row=row, column=2, columnspan=2, sticky='w', padx=(10, 0))
 
         # Font size
         font_size = widget.get_property('font_size', 3)
         font_size_var = tk.IntVar(value=font_size)
+        self._bind_var('font_size', font_size_var, lambda w: w.get_property('font_size', 3))
 
-        font_frame = ttk.Frame(self.property_frame)
-        font_frame.pack(fill=tk.X, pady=(0, 10))
-
-        ttk.Label(font_frame, text="Font Size:").pack(side=tk.LEFT)
+        row = self._next_row()
+        ttk.Label(frame, text="Font Size:").grid(row=row, column=0, sticky='w', pady=10)
         font_spinbox = ttk.Spinbox(
-            font_frame,
+            frame,
             from_=2,
             to=6,
             textvariable=font_size_var,
             width=10
         )
-        font_spinbox.pack(side=tk.LEFT, padx=5)
+        font_spinbox.grid(row=row, column=1, sticky='w', padx=5, pady=10)
 
         # Text color
         text_color = widget.get_property('text_color', (255, 255, 255))
-        color_frame = ttk.Frame(self.property_frame)
-        color_frame.pack(fill=tk.X, pady=(0, 10))
-
-        ttk.Label(color_frame, text="Text Color:").pack(anchor=tk.W, pady=(0, 5))
-
-        rgb_frame = ttk.Frame(color_frame)
-        rgb_frame.pack(fill=tk.X)
+        self._grid_label("Text Color:", pady=(10, 5))
 
         r_var = tk.IntVar(value=text_color[0])
         g_var = tk.IntVar(value=text_color[1])
         b_var = tk.IntVar(value=text_color[2])
-
-        ttk.Label(rgb_frame, text="R:").pack(side=tk.LEFT)
-        r_spinbox = ttk.Spinbox(rgb_frame, from_=0, to=255, textvariable=r_var, width=5)
-        r_spinbox.pack(side=tk.LEFT, padx=(5, 10))
-
-        ttk.Label(rgb_frame, text="G:").pack(side=tk.LEFT)
-        g_spinbox = ttk.Spinbox(rgb_frame, from_=0, to=255, textvariable=g_var, width=5)
-        g_spinbox.pack(side=tk.LEFT, padx=5)
-
-        ttk.Label(rgb_frame, text="B:").pack(side=tk.LEFT)
-        b_spinbox = ttk.Spinbox(rgb_frame, from_=0, to=255, textvariable=b_var, width=5)
-        b_spinbox.pack(side=tk.LEFT, padx=5)
+        self._bind_color_vars('text_color', (r_var, g_var, b_var))
+        self._grid_rgb(self._next_row(), (r_var, g_var, b_var))
 
         # Bind change events
-        def on_weather_change():
+        def apply_weather(widget):
             widget.set_property('temperature_unit', temp_unit_var.get())
             widget.set_property('font_size', font_size_var.get())
             widget.set_property('text_color', (r_var.get(), g_var.get(), b_var.get()))
 
-            if self.on_property_changed:
-                self.on_property_changed(widget)
-
-        temp_unit_var.trace('w', lambda *args: on_weather_change())
-        font_size_var.trace('w', lambda *args: on_weather_change())
-        r_var.trace('w', lambda *args: on_weather_change())
-        g_var.trace('w', lambda *args: on_weather_change())
-        b_var.trace('w', lambda *args: on_weather_change())
\ No newline at end of file
+        self._appliers.append(apply_weather)
+        for var in (temp_unit_var, font_size_var, r_var, g_var, b_var):
+            var.trace_add('write', self._schedule_commit)
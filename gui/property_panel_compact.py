@@ -222,6 +222,7 @@ class CompactPropertyPanel:
                 widget.z_index = z_val
                 widget.update_interval = interval_val
                 widget.visible = visible_val
+                widget.mark_changed()
 
                 if self.on_property_changed:
                     self.on_property_changed(widget)
@@ -1,8 +1,165 @@
 """
 Undo/Redo manager for GUI operations
 """
-from typing import List, Dict, Any, Callable, Optional
-import copy
+from dataclasses import dataclass
+import time
+from typing import List, Dict, Any, Callable, Optional, Tuple
+
+from widgets.base_widget import clone_value
+
+# Widget fields captured for property undo, besides the properties dict
+_WIDGET_FIELDS = ('x', 'y', 'width', 'height', 'visible', 'z_index', 'update_interval')
+
+
+def widget_state(widget) -> Dict[str, Any]:
+    """
+    Capture the editable state of a single widget
+
+    Args:
+        widget: Widget to capture
+
+    Returns:
+        Dictionary of widget fields plus a copy of its properties
+    """
+    state = {field: getattr(widget, field) for field in _WIDGET_FIELDS}
+    # Property values may be lists (e.g. colors loaded from JSON); clone them
+    # so later in-place edits cannot leak into the undo history
+    state['properties'] = clone_value(widget.properties)
+    return state
+
+
+class UndoPatch:
+    """A reversible change to a LayoutManager"""
+
+    def apply(self, layout_manager):
+        """Apply the change to the layout"""
+        raise NotImplementedError
+
+    def invert(self) -> 'UndoPatch':
+        """Get the patch that reverts this change"""
+        raise NotImplementedError
+
+    def merge(self, other: 'UndoPatch') -> bool:
+        """
+        Fold a later change into this patch
+
+        Args:
+            other: Patch applied right after this one
+
+        Returns:
+            True if merged, False if the patches must stay separate
+        """
+        return False
+
+
+@dataclass
+class MovePatch(UndoPatch):
+    """Widget moved from one position to another"""
+    widget: Any
+    old_xy: Tuple[int, int]
+    new_xy: Tuple[int, int]
+
+    def apply(self, layout_manager):
+        self.widget.set_position(*self.new_xy)
+
+    def invert(self) -> 'MovePatch':
+        return MovePatch(self.widget, self.new_xy, self.old_xy)
+
+    def merge(self, other: UndoPatch) -> bool:
+        if not isinstance(other, MovePatch) or other.widget is not self.widget:
+            return False
+        self.new_xy = other.new_xy
+        return True
+
+
+@dataclass
+class AddPatch(UndoPatch):
+    """Widget inserted into the layout at an index"""
+    widget: Any
+    index: int
+
+    def apply(self, layout_manager):
+        layout_manager.widgets.insert(self.index, self.widget)
+        layout_manager.note_z_index(self.widget)
+
+    def invert(self) -> 'RemovePatch':
+        return RemovePatch(self.widget, self.index)
+
+
+@dataclass
+class RemovePatch(UndoPatch):
+    """Widget removed from the layout at an index"""
+    widget: Any
+    index: int
+
+    def apply(self, layout_manager):
+        layout_manager.remove_widget(self.widget)
+
+    def invert(self) -> AddPatch:
+        return AddPatch(self.widget, self.index)
+
+
+@dataclass
+class PropertyPatch(UndoPatch):
+    """Changed widget fields and properties; only differing keys are stored"""
+    widget: Any
+    old: Dict[str, Any]
+    new: Dict[str, Any]
+
+    @classmethod
+    def between(cls, widget, old_state: Dict[str, Any],
+                new_state: Dict[str, Any]) -> Optional['PropertyPatch']:
+        """
+        Build a patch from two widget_state() captures
+
+        Returns:
+            PropertyPatch, or None if nothing changed
+        """
+        old, new = {}, {}
+        for field in _WIDGET_FIELDS:
+            if old_state[field] != new_state[field]:
+                old[field] = old_state[field]
+                new[field] = new_state[field]
+
+        old_props, new_props = old_state['properties'], new_state['properties']
+        changed = {key for key in old_props.keys() | new_props.keys()
+                   if old_props.get(key) != new_props.get(key)}
+        if changed:
+            old['properties'] = {key: old_props.get(key) for key in changed}
+            new['properties'] = {key: new_props.get(key) for key in changed}
+
+        return cls(widget, old, new) if new else None
+
+    def apply(self, layout_manager):
+        for field, value in self.new.items():
+            if field == 'properties':
+                self.widget.properties.update(clone_value(value))
+            else:
+                setattr(self.widget, field, value)
+        self.widget.mark_changed()
+        if 'z_index' in self.new:
+            layout_manager.note_z_index(self.widget)
+
+    def invert(self) -> 'PropertyPatch':
+        return PropertyPatch(self.widget, self.new, self.old)
+
+    def merge(self, other: UndoPatch) -> bool:
+        if not isinstance(other, PropertyPatch) or other.widget is not self.widget:
+            return False
+        # Earliest old value and latest new value win for every key
+        for field, value in other.old.items():
+            if field == 'properties':
+                merged = dict(value)
+                merged.update(self.old.get('properties', {}))
+                self.old['properties'] = merged
+            else:
+                self.old.setdefault(field, value)
+        for field, value in other.new.items():
+            if field == 'properties':
+                self.new.setdefault('properties', {}).update(value)
+            else:
+                self.new[field] = value
+        return True
 
 
 class UndoManager:
@@ -20,19 +177,37 @@ class UndoManager:
         self.redo_stack: List[Dict[str, Any]] = []
         self.current_state = None
     
-    def save_state(self, description: str, state: Any = None):
+    def save_state(self, description: str, state: Any = None, merge_within: float = 0):
         """
         Save current state for undo
         
         Args:
             description: Description of the operation
-            state: State to save (None for auto-detect)
+            state: State to save (None for auto-detect), an UndoPatch, or a
+                zero-argument callable that produces it when the history is
+                next touched
+            merge_within: Seconds within which an UndoPatch is folded into the
+                previous operation with the same description, if it accepts it
         """
+        if merge_within and isinstance(state, UndoPatch) and self.undo_stack and not self.redo_stack:
+            last = self.undo_stack[-1]
+            if (last['description'] == description
+                    and time.monotonic() - last['time'] < merge_within
+                    and isinstance(last['state'], UndoPatch)
+                    and last['state'].merge(state)):
+                last['time'] = time.monotonic()
+                return last
+
+        # A deferred state describes the live layout, so it must be captured
+        # before the operation being saved now changes that layout
+        self.commit_pending()
+
         # If no state provided, we'll expect the caller to capture state
         operation = {
             'description': description,
             'state': state,
-            'timestamp': self._get_timestamp()
+            'timestamp': self._get_timestamp(),
+            'time': time.monotonic()
         }
         
         self.undo_stack.append(operation)
@@ -46,6 +221,30 @@ class UndoManager:
         
         return operation
     
+    def mark_pending(self, description: str, factory: Callable[[], Any]) -> Dict[str, Any]:
+        """
+        Save an operation whose state is only built when it is committed
+        
+        Args:
+            description: Description of the operation
+            factory: Zero-argument callable returning the state, or None if
+                the operation turned out to change nothing
+            
+        Returns:
+            Operation dictionary, which stays pending until committed
+        """
+        return self.save_state(description, factory)
+    
+    def is_pending(self, operation: Dict[str, Any]) -> bool:
+        """Check whether an operation is still the uncommitted top of the history"""
+        return bool(self.undo_stack) and self.undo_stack[-1] is operation and callable(operation['state'])
+    
+    def commit_pending(self):
+        """Build the state of a pending operation, dropping it if it changed nothing"""
+        if self.undo_stack and callable(self.undo_stack[-1]['state']):
+            if self._resolve(self.undo_stack[-1])['state'] is None:
+                self.undo_stack.pop()
+    
     def undo(self) -> Optional[Dict[str, Any]]:
         """
         Undo the last operation
@@ -53,6 +252,7 @@ class UndoManager:
         Returns:
             Operation dictionary if undo was possible, None otherwise
         """
+        self.commit_pending()
         if not self.undo_stack:
             return None
         
@@ -71,7 +271,7 @@ class UndoManager:
         if not self.redo_stack:
             return None
         
-        operation = self.redo_stack.pop()
+        operation = self._resolve(self.redo_stack.pop())
         self.undo_stack.append(operation)
         
         return operation
@@ -103,6 +303,12 @@ class UndoManager:
         self.undo_stack.clear()
         self.redo_stack.clear()
     
+    def _resolve(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        """Materialize a deferred state in place"""
+        if callable(operation['state']):
+            operation['state'] = operation['state']()
+        return operation
+    
     def _get_timestamp(self) -> str:
         """Get current timestamp string"""
         import datetime
@@ -5,7 +5,14 @@ Handles widget positioning, layering, and rendering coordination
 from typing import List, Dict, Any, Optional, Tuple, Type, Union
 import datetime
 
-from widgets.base_widget import BaseWidget
+from widgets.base_widget import BaseWidget, clone_value
+
+
+def _detached_widget_dict(widget: BaseWidget) -> Dict[str, Any]:
+    """Widget dict whose properties are a copy rather than the live dict"""
+    data = widget.to_dict()
+    data['properties'] = clone_value(data['properties'])
+    return data
 
 
 class WidgetFactory:
@@ -145,6 +152,11 @@ class LayoutManager:
         self.screen_size = screen_size
         self.widgets: List[BaseWidget] = []
         self.background_color: Tuple[int, int, int] = (0, 0, 0)  # Default black background
+        self._dict_cache: Optional[Tuple[Tuple, Dict[str, Any]]] = None  # (version, to_dict result)
+        # Bounds on the widgets' z-indexes; they may lie outside the actual
+        # range after z-index edits but never inside it
+        self._max_z = 0
+        self._min_z = 0
 
     def add_widget(self, widget: BaseWidget):
         """
@@ -166,6 +178,8 @@ class LayoutManager:
         """
         if widget in self.widgets:
             self.widgets.remove(widget)
+            if widget.z_index in (self._max_z, self._min_z):
+                self._update_z_bounds()
 
     def get_widget_at(self, x: int, y: int) -> Optional[BaseWidget]:
         """
@@ -231,6 +245,30 @@ class LayoutManager:
     def _sort_widgets(self):
         """Sort widgets by z-index"""
         self.widgets.sort(key=lambda w: w.z_index)
+        if self.widgets:
+            self._min_z = self.widgets[0].z_index
+            self._max_z = self.widgets[-1].z_index
+
+    def note_z_index(self, widget: BaseWidget):
+        """
+        Widen the z-index bounds to cover a widget whose z-index was assigned
+
+        Args:
+            widget: Widget in this layout
+        """
+        z = widget.z_index
+        if z > self._max_z:
+            self._max_z = z
+        elif z < self._min_z:
+            self._min_z = z
+
+    def _update_z_bounds(self):
+        """Recompute the z-index bounds from the widgets"""
+        if self.widgets:
+            self._max_z = max(w.z_index for w in self.widgets)
+            self._min_z = min(w.z_index for w in self.widgets)
+        else:
+            self._max_z = self._min_z = 0
 
     def _sorted_widgets(self) -> List[BaseWidget]:
         """Get widgets sorted by z-index (lowest to highest)"""
@@ -304,18 +342,35 @@ class LayoutManager:
 
         return updated_widgets
 
+    @property
+    def _version(self) -> Tuple:
+        """Token that changes whenever the serialized layout would change"""
+        return (self.screen_size, tuple(self.background_color),
+                tuple(widget._version for widget in self.widgets))
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert layout to dictionary representation
 
+        The result is cached until the layout or one of its widgets changes
+        (see BaseWidget.mark_changed), so callers must treat it as read-only.
+        Property values are copied, so the result never shares state with
+        the live widgets.
+
         Returns:
             Dictionary representation of layout
         """
-        return {
+        version = self._version
+        if self._dict_cache is not None and self._dict_cache[0] == version:
+            return self._dict_cache[1]
+
+        data = {
             'screen_size': self.screen_size,
             'background_color': list(self.background_color),
-            'widgets': [widget.to_dict() for widget in self.widgets]
+            'widgets': [_detached_widget_dict(widget) for widget in self.widgets]
         }
+        self._dict_cache = (version, data)
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'LayoutManager':
@@ -328,29 +383,43 @@ class LayoutManager:
         Returns:
             LayoutManager instance
         """
-        screen_size = data.get('screen_size', 64)
-        layout = cls(screen_size)
+        layout = cls(data.get('screen_size', 64))
+        layout.load_from_dict(data)
+        return layout
+
+    def load_from_dict(self, data: Dict[str, Any]):
+        """
+        Replace this layout's contents from a dictionary, keeping the same
+        LayoutManager instance (and widgets list) for anyone holding it
+
+        Args:
+            data: Dictionary representation of layout
+        """
+        self.screen_size = data.get('screen_size', 64)
 
         # Set background color
         bg_color = data.get('background_color', [0, 0, 0])
-        layout.background_color = tuple(bg_color) if len(bg_color) == 3 else (0, 0, 0)
+        self.background_color = tuple(bg_color) if len(bg_color) == 3 else (0, 0, 0)
 
         # Get widget factory
-        factory = cls.get_widget_factory()
+        factory = self.get_widget_factory()
 
         # Create widgets
+        widgets = []
         for widget_data in data.get('widgets', []):
             widget_type = widget_data.get('type')
 
             # Try to create widget using factory
-            widget = factory.create_widget(widget_type, widget_data, screen_size)
+            widget = factory.create_widget(widget_type, widget_data, self.screen_size)
 
             if widget:
-                layout.add_widget(widget)
+                widgets.append(widget)
             else:
                 print(f"Warning: Unknown widget type '{widget_type}' skipped during layout loading")
 
-        return layout
+        # Sort once rather than on every insert
+        self.widgets[:] = widgets
+        self._sort_widgets()
 
     @classmethod
     def get_widget_factory(cls) -> 'WidgetFactory':
@@ -4,7 +4,6 @@ Main application for Pixoomat - Time display for Divoom Pixoo 64
 import signal
 import sys
 import time
-import datetime
 import json
 from typing import Optional, Dict, Any
 
@@ -15,7 +14,6 @@ from widgets import get_plugin_manager
 from layout_manager import LayoutManager
 from device_discovery import PixooDiscovery, test_connection
 from weather_service import WeatherService
-from widgets.plugins.weather_widget import WeatherWidget
 
 
 # CustomPixoo class moved to pixoo_client.py
@@ -28,7 +26,7 @@ class PixoomatApp:
         self.pixoo: Optional[Pixoo] = None
         self.layout_manager = LayoutManager(config.screen_size)
         self.weather_service = WeatherService(config.weather_interval) if config.show_weather else None
-        self.last_update = datetime.datetime.min
+        self.last_update: Optional[float] = None  # time.monotonic() of last push
         self.running = False
 
         # Initialize default widgets if no layout config provided
@@ -73,7 +71,7 @@ class PixoomatApp:
                 weather_widget.z_index = 1  # Place above clock if overlapping
 
                 # Connect weather service to widget
-                if isinstance(weather_widget, WeatherWidget):
+                if weather_widget.REQUIRES_WEATHER_SERVICE:
                     weather_widget.get_weather_data = self.weather_service.get_weather
 
                 # Add to layout
@@ -93,7 +91,7 @@ class PixoomatApp:
             # Connect weather service to weather widgets
             if self.weather_service:
                 for widget in self.layout_manager.widgets:
-                    if isinstance(widget, WeatherWidget):
+                    if widget.REQUIRES_WEATHER_SERVICE:
                         widget.get_weather_data = self.weather_service.get_weather
 
             print(f"Loaded layout from {layout_config_path}")
@@ -170,8 +168,7 @@ class PixoomatApp:
             return
 
         # Check if we need to update
-        time_since_last = (datetime.datetime.now() - self.last_update).total_seconds()
-        if time_since_last < self.config.update_interval:
+        if self.last_update is not None and time.monotonic() - self.last_update < self.config.update_interval:
             return
 
         try:
@@ -190,7 +187,7 @@ class PixoomatApp:
 
             # Push to device
             self.pixoo.push()
-            self.last_update = datetime.datetime.now()
+            self.last_update = time.monotonic()
 
             if self.config.debug:
                 print(f"DISPLAY: Updated display, {len(updated_widgets)} widgets updated")
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test script for ClockDisplay formatting helpers
+"""
+import sys
+import os
+import datetime
+import time
+
+# Add the project root directory to sys.path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clock_display import ClockDisplay
+
+
+def test_clock_display_snapshot():
+    """Test that all display helpers agree on a single snapshot"""
+    print("Testing ClockDisplay snapshot threading...")
+
+    clock = ClockDisplay(64)
+    now = datetime.datetime(2024, 3, 9, 14, 5, 59)
+
+    time_data = clock.get_time_display_data("24", now)
+    assert time_data['text'] == "14:05", f"Unexpected 24h text: {time_data['text']}"
+
+    time_data_12 = clock.get_time_display_data("12", now)
+    assert time_data_12['text'] == "02:05 PM", f"Unexpected 12h text: {time_data_12['text']}"
+
+    date_data = clock.get_date_display_data(now)
+    assert date_data['text'] == "03/09", f"Unexpected date text: {date_data['text']}"
+
+    assert (time_data["x"], time_data["y"]) == (22, 29), "Unexpected 24h position"
+    assert clock.calculate_text_position("12:00 AM") == (16, 29), "Unexpected 12h position"
+
+    seconds = clock.get_seconds_indicator(now)
+    assert seconds['width'] == int((59 / 60) * (64 - 10)), "Seconds bar width mismatch"
+
+    # Same minute is served from the cache, next minute is reformatted
+    later = now + datetime.timedelta(seconds=1)
+    assert clock.format_time("24", now.replace(second=1)) == "14:05"
+    assert clock.format_time("24", later) == "14:06"
+    assert clock.get_date_display_data(later + datetime.timedelta(days=1))['text'] == "03/10"
+
+    # Default still uses the current time
+    assert isinstance(clock.snapshot(), datetime.datetime)
+    assert clock.get_time_display_data("24")['format'] == "24"
+
+    print("✓ ClockDisplay snapshot threading works")
+
+    # Update checks use monotonic timestamps
+    assert clock.should_update_display(time.monotonic() - 5, 1)
+    assert not clock.should_update_display(time.monotonic(), 60)
+    print("✓ ClockDisplay update interval check works")
+
+
+if __name__ == "__main__":
+    test_clock_display_snapshot()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test script for PixoomatConfig loading and saving
+"""
+import sys
+import os
+import json
+import tempfile
+
+# Add the project root directory to sys.path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import PixoomatConfig, create_argument_parser
+
+
+def test_config_file_cache():
+    """Test that from_file reuses parsed configs until the file changes"""
+    print("Testing PixoomatConfig.from_file caching...")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "config.json")
+        with open(path, 'w') as f:
+            json.dump({'ip_address': '10.0.0.5', 'brightness': 40,
+                       'text_color': [1, 2, 3], 'unknown_key': True}, f)
+
+        first = PixoomatConfig.from_file(path)
+        second = PixoomatConfig.from_file(path)
+        assert first.ip_address == '10.0.0.5' and first.brightness == 40
+        assert first.text_color == (1, 2, 3), "Colors should load as tuples"
+        assert not hasattr(first, 'unknown_key'), "Unknown keys should be ignored"
+        assert first is not second, "Cached config must be copied on return"
+
+        # Mutating a returned config must not leak into the cache
+        first.brightness = 10
+        assert PixoomatConfig.from_file(path).brightness == 40
+
+        # Rewriting the file invalidates the cache
+        with open(path, 'w') as f:
+            json.dump({'ip_address': '10.0.0.6'}, f)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert PixoomatConfig.from_file(path).ip_address == '10.0.0.6'
+
+    print("✓ PixoomatConfig.from_file caching works")
+
+
+def test_config_round_trip():
+    """Test that to_file writes every field and from_file reads it back"""
+    print("Testing PixoomatConfig save/load round trip...")
+
+    config = PixoomatConfig(ip_address='10.0.0.7', brightness=55, text_color=(9, 8, 7))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "config.json")
+        config.to_file(path)
+
+        with open(path) as f:
+            data = json.load(f)
+        assert data['text_color'] == [9, 8, 7], "Colors should be saved as lists"
+        assert '_file_cache' not in data, "Class attributes must not be saved"
+
+        assert PixoomatConfig.from_file(path) == config, "Round trip changed the config"
+
+    print("✓ PixoomatConfig save/load round trip works")
+
+
+def test_config_from_args():
+    """Test that command line arguments map onto config fields"""
+    print("Testing PixoomatConfig.from_args...")
+
+    parser = create_argument_parser()
+    assert PixoomatConfig.from_args(parser.parse_args([])) == PixoomatConfig()
+
+    args = parser.parse_args(['--ip', '10.0.0.8', '--port', '8080', '--format', '12',
+                              '--no-weather', '--discover', '--color', '1,2,3'])
+    config = PixoomatConfig.from_args(args)
+    assert config.ip_address == '10.0.0.8' and config.port == 8080
+    assert config.time_format == '12' and config.auto_discover
+    assert not config.show_weather and config.text_color == (1, 2, 3)
+
+    print("✓ PixoomatConfig.from_args works")
+
+
+if __name__ == "__main__":
+    test_config_file_cache()
+    test_config_round_trip()
+    test_config_from_args()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test script for LayoutManager loading and ordering
+"""
+import sys
+import os
+
+# Add the project root directory to sys.path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from layout_manager import LayoutManager
+from widgets.plugin_system import get_plugin_manager
+
+
+def _make_layout(count: int = 3) -> LayoutManager:
+    """Build a layout of SimpleText widgets with descending z-indexes"""
+    plugin_manager = get_plugin_manager()
+    plugin_manager.load_all_plugins()
+
+    layout = LayoutManager(64)
+    for i in range(count):
+        widget = plugin_manager.create_widget("SimpleText", x=i, y=i, width=10, height=6)
+        widget.z_index = count - i
+        widget.set_property('text', f"W{i}")
+        layout.add_widget(widget)
+    return layout
+
+
+def test_load_from_dict_in_place():
+    """Test that load_from_dict replaces contents without replacing the manager"""
+    print("Testing LayoutManager.load_from_dict...")
+
+    source = _make_layout()
+    target = LayoutManager(32)
+    widgets_list = target.widgets
+
+    target.load_from_dict(source.to_dict())
+
+    assert target.widgets is widgets_list, "Widget list identity should be preserved"
+    assert target.screen_size == 64, "Screen size should come from the data"
+    assert [w.z_index for w in target.widgets] == [1, 2, 3], "Widgets should be sorted by z-index"
+    assert target.to_dict() == LayoutManager.from_dict(source.to_dict()).to_dict()
+
+    print("✓ LayoutManager.load_from_dict works")
+
+
+def test_to_dict_cache():
+    """Test that to_dict is reused until the layout or a widget changes"""
+    print("Testing LayoutManager.to_dict caching...")
+
+    layout = _make_layout()
+    first = layout.to_dict()
+    assert layout.to_dict() is first, "Unchanged layout should reuse the cached dict"
+
+    widget = layout.widgets[0]
+    widget.set_position(5, 7)
+    moved = layout.to_dict()
+    assert moved is not first and moved['widgets'][0]['x'] == 5
+
+    widget.visible = False
+    widget.mark_changed()
+    assert layout.to_dict()['widgets'][0]['visible'] is False
+
+    layout.background_color = (1, 2, 3)
+    assert layout.to_dict()['background_color'] == [1, 2, 3]
+
+    layout.remove_widget(widget)
+    assert len(layout.to_dict()['widgets']) == 2
+
+    # set_property stamps a new version; the cached dict holds a detached copy
+    layout.widgets[0].set_property('text', "Edited")
+    edited = layout.to_dict()
+    assert edited['widgets'][0]['properties']['text'] == "Edited"
+    layout.widgets[0].properties['text'] = "Raw"
+    assert edited['widgets'][0]['properties']['text'] == "Edited", "Cached dict must not share properties"
+
+    print("✓ LayoutManager.to_dict caching works")
+
+
+def test_z_bounds():
+    """Test that the z-index bounds follow adds, removals and assignments"""
+    print("Testing LayoutManager z-index bounds...")
+
+    layout = _make_layout()
+    assert (layout._min_z, layout._max_z) == (1, 3)
+
+    top = layout.widgets[-1]
+    layout.remove_widget(top)
+    assert layout._max_z == 2, "Removing the top widget should lower the bound"
+
+    widget = layout.widgets[0]
+    widget.z_index = 10
+    layout.note_z_index(widget)
+    assert layout._max_z == 10
+
+    widget.z_index = -4
+    layout.note_z_index(widget)
+    assert layout._min_z == -4 and layout._max_z == 10, "Bounds only ever widen"
+
+    layout.remove_widget(widget)
+    assert (layout._min_z, layout._max_z) == (2, 2)
+
+    print("✓ LayoutManager z-index bounds work")
+
+
+if __name__ == "__main__":
+    test_load_from_dict_in_place()
+    test_to_dict_cache()
+    test_z_bounds()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Test script for UndoManager history handling
+"""
+import sys
+import os
+
+# Add the project root directory to sys.path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gui.undo_manager import (UndoManager, MovePatch, AddPatch, RemovePatch,
+                               PropertyPatch, widget_state)
+from layout_manager import LayoutManager
+from widgets import get_plugin_manager
+
+
+def _make_layout(count: int = 3) -> LayoutManager:
+    """Build a layout of SimpleText widgets with descending z-indexes"""
+    plugin_manager = get_plugin_manager()
+    plugin_manager.load_all_plugins()
+
+    layout = LayoutManager(64)
+    for i in range(count):
+        widget = plugin_manager.create_widget("SimpleText", x=i, y=i, width=10, height=6)
+        widget.z_index = count - i
+        widget.set_property('text', f"W{i}")
+        layout.add_widget(widget)
+    return layout
+
+
+def test_deferred_state():
+    """Test that callable states are captured lazily, before the next operation"""
+    print("Testing UndoManager deferred states...")
+
+    live = {'x': 1}
+    calls = []
+
+    def snapshot():
+        calls.append(dict(live))
+        return dict(live)
+
+    manager = UndoManager()
+    manager.save_state("Moved widget", snapshot)
+    assert not calls, "Deferred state should not be captured on save"
+
+    # Undo materializes the state from the live layout
+    operation = manager.undo()
+    assert operation['state'] == {'x': 1} and len(calls) == 1
+
+    # Redo hands back the already captured state
+    assert manager.redo()['state'] == {'x': 1} and len(calls) == 1
+
+    # A new operation freezes the pending one before it changes the layout
+    live['x'] = 2
+    manager.save_state("Moved widget", snapshot)
+    manager.save_state("Modified widget", {'x': 2})
+    live['x'] = 3
+    assert len(calls) == 2, "Pending state should be captured by the next save"
+    assert manager.undo_stack[-2]['state'] == {'x': 2}
+
+    print("✓ UndoManager deferred states work")
+
+
+def test_pending_operations():
+    """Test that pending operations are built on commit and dropped if empty"""
+    print("Testing UndoManager pending operations...")
+
+    layout = _make_layout()
+    widget = layout.widgets[0]
+    baseline = widget_state(widget)
+
+    manager = UndoManager()
+    operation = manager.mark_pending("Modified widget",
+                                     lambda: PropertyPatch.between(widget, baseline, widget_state(widget)))
+    assert manager.is_pending(operation)
+
+    # Every edit of the burst lands in the same entry
+    widget.set_property('text', "A")
+    widget.set_property('text', "AB")
+    manager.commit_pending()
+    assert not manager.is_pending(operation) and len(manager.undo_stack) == 1
+    assert operation['state'].new == {'properties': {'text': "AB"}}
+
+    # A pending operation that changed nothing leaves no history behind
+    manager.mark_pending("Modified widget", lambda: None)
+    assert manager.undo()['state'] is operation['state']
+    assert not manager.undo_stack
+
+    print("✓ UndoManager pending operations work")
+
+
+def test_undo_patches():
+    """Test that each patch and its inverse round-trip the layout"""
+    print("Testing undo patches...")
+
+    layout = _make_layout()
+    original = layout.to_dict()
+    widget = layout.widgets[1]
+
+    def round_trip(patch):
+        """Apply a patch, check the layout changed, then revert it"""
+        patch.apply(layout)
+        assert layout.to_dict() != original, f"{patch} did not change the layout"
+        patch.invert().apply(layout)
+        assert layout.to_dict() == original, f"{patch} was not reverted"
+
+    round_trip(MovePatch(widget, (widget.x, widget.y), (20, 30)))
+    round_trip(RemovePatch(widget, 1))
+    assert layout.widgets[1] is widget, "Undoing a removal should restore the same widget"
+
+    extra = _make_layout(1).widgets[0]
+    round_trip(AddPatch(extra, 0))
+
+    before = widget_state(widget)
+    widget.set_property('text', "Changed")
+    widget.visible = False
+    patch = PropertyPatch.between(widget, before, widget_state(widget))
+    assert set(patch.new) == {'visible', 'properties'}, "Only changed fields should be stored"
+    assert patch.new['properties'] == {'text': "Changed"}
+    patch.invert().apply(layout)
+    assert layout.to_dict() == original, "Property patch was not reverted"
+    assert PropertyPatch.between(widget, before, widget_state(widget)) is None
+
+    print("✓ Undo patches work")
+
+
+def test_coalesced_patches():
+    """Test that quick repeated changes to one widget share an undo entry"""
+    print("Testing undo patch coalescing...")
+
+    layout = _make_layout()
+    widget, other = layout.widgets[0], layout.widgets[1]
+    manager = UndoManager()
+
+    manager.save_state("Moved widget", MovePatch(widget, (0, 0), (1, 0)), merge_within=1)
+    manager.save_state("Moved widget", MovePatch(widget, (1, 0), (2, 0)), merge_within=1)
+    assert len(manager.undo_stack) == 1, "Consecutive moves should be merged"
+    assert manager.undo_stack[0]['state'].new_xy == (2, 0)
+    assert manager.undo_stack[0]['state'].old_xy == (0, 0)
+
+    # A different widget, or merging disabled, starts a new entry
+    manager.save_state("Moved widget", MovePatch(other, (1, 1), (2, 2)), merge_within=1)
+    manager.save_state("Moved widget", MovePatch(other, (2, 2), (3, 3)))
+    assert len(manager.undo_stack) == 3
+
+    # Property edits keep the earliest old and the latest new values
+    manager.save_state("Modified", PropertyPatch(widget, {'properties': {'text': 'a'}},
+                                                 {'properties': {'text': 'b'}}), merge_within=1)
+    manager.save_state("Modified", PropertyPatch(widget, {'properties': {'text': 'b'}, 'x': 0},
+                                                 {'properties': {'text': 'c'}, 'x': 5}), merge_within=1)
+    patch = manager.undo_stack[-1]['state']
+    assert patch.old == {'properties': {'text': 'a'}, 'x': 0}
+    assert patch.new == {'properties': {'text': 'c'}, 'x': 5}
+
+    print("✓ Undo patch coalescing works")
+
+
+if __name__ == "__main__":
+    test_deferred_state()
+    test_pending_operations()
+    test_undo_patches()
+    test_coalesced_patches()
@@ -115,5 +115,42 @@ def test_widget_serialization():
 
     print("\n✓ All serialization tests completed!")
 
+def test_widget_reset():
+    """Test that a reset widget serializes like a freshly created one"""
+    print("Testing widget reset...")
+
+    plugin_manager = get_plugin_manager()
+    for name in ("Clock", "SimpleText", "ProgressBar"):
+        widget = plugin_manager.create_widget(name)
+        # to_dict shares the live properties dict, so keep a copy
+        fresh = dict(widget.to_dict(), properties=dict(widget.properties))
+        widget.set_position(7, 9)
+        widget.z_index = 4
+        widget.set_property('edited', True)
+        widget.reset()
+        assert widget.to_dict() == fresh, f"{name} did not reset to its defaults"
+
+    print("✓ Widget reset works")
+
+def test_widget_clone():
+    """Test that a clone matches its source but shares no nested values"""
+    print("Testing widget clone...")
+
+    widget = get_plugin_manager().create_widget("SimpleText", x=3, y=4, width=20, height=8)
+    widget.z_index = 2
+    widget.set_property('color', [1, 2, 3])
+
+    copy = widget.clone()
+    assert type(copy) is type(widget) and copy is not widget
+    assert copy.to_dict() == widget.to_dict(), "Clone should serialize like its source"
+
+    copy.properties['color'][0] = 99
+    assert widget.properties['color'] == [1, 2, 3], "Clone must not share nested values"
+
+    print("✓ Widget clone works")
+
+
 if __name__ == "__main__":
-    test_widget_serialization()
\ No newline at end of file
+    test_widget_serialization()
+    test_widget_reset()
+    test_widget_clone()
\ No newline at end of file
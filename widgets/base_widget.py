@@ -5,11 +5,34 @@ Provides common functionality and interface for all display widgets
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Tuple, Optional
 import datetime
+import itertools
+
+# Source of widget versions; one global counter so they never repeat across widgets
+_versions = itertools.count(1)
+
+
+def clone_value(obj: Any) -> Any:
+    """
+    Deep-copy plain data (dicts, lists, tuples and scalars)
+
+    Much cheaper than copy.deepcopy for JSON-like values since it skips
+    the memo table and the generic copy protocol.
+    """
+    if isinstance(obj, dict):
+        return {key: clone_value(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [clone_value(value) for value in obj]
+    if isinstance(obj, tuple):
+        return tuple(clone_value(value) for value in obj)
+    return obj
 
 
 class BaseWidget(ABC):
     """Base class for all display widgets"""
 
+    # Widgets that set this get the app's weather service as get_weather_data
+    REQUIRES_WEATHER_SERVICE = False
+
     def __init__(self, x: int = 0, y: int = 0, width: Optional[int] = None, height: Optional[int] = None, screen_size: int = 64):
         """
         Initialize widget with position and size
@@ -21,6 +44,7 @@ class BaseWidget(ABC):
             height: Widget height in pixels (None for default)
             screen_size: Screen size in pixels for calculating default sizes
         """
+        self._version = next(_versions)  # See mark_changed()
         self.screen_size = screen_size
         self.x = x
         self.y = y
@@ -49,6 +73,40 @@ class BaseWidget(ABC):
             self.width = width
             self.height = height
 
+    def mark_changed(self):
+        """
+        Stamp a new version so cached serializations of this widget are rebuilt
+
+        The setters call this; code that assigns serialized fields (x, visible,
+        z_index, properties, ...) directly must call it afterwards.
+        """
+        self._version = next(_versions)
+
+    def clone(self) -> 'BaseWidget':
+        """
+        Create an independent copy of this widget
+
+        Returns:
+            Widget of the same type with the same fields; nested property
+            values are copied so the two widgets never share them
+        """
+        widget = self.__class__()
+        widget.screen_size = self.screen_size
+        widget.x = self.x
+        widget.y = self.y
+        widget.width = self.width
+        widget.height = self.height
+        widget.visible = self.visible
+        widget.z_index = self.z_index
+        widget.update_interval = self.update_interval
+        widget.properties = clone_value(self.properties)
+        return widget
+
+    def reset(self):
+        """Return the widget to the state of a freshly created default instance"""
+        self.__dict__.clear()
+        self.__init__()
+
     def _init_properties(self):
         """Initialize widget-specific properties. Override in subclasses."""
         pass
@@ -86,15 +144,18 @@ class BaseWidget(ABC):
         """Set widget position"""
         self.x = x
         self.y = y
+        self._version = next(_versions)
 
     def set_size(self, width: int, height: int):
         """Set widget size"""
         self.width = width
         self.height = height
+        self._version = next(_versions)
 
     def set_property(self, key: str, value: Any):
         """Set a widget-specific property"""
         self.properties[key] = value
+        self._version = next(_versions)
 
     def get_property(self, key: str, default: Any = None) -> Any:
         """Get a widget-specific property"""
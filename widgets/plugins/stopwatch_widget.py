@@ -45,8 +45,8 @@ class StopwatchWidget(BaseWidget):
             start_time_str = self.get_property('start_time')
             if not start_time_str:
                 # Start the stopwatch
-                self.properties['start_time'] = datetime.datetime.now().isoformat()
-                start_time_str = self.properties['start_time']
+                start_time_str = datetime.datetime.now().isoformat()
+                self.set_property('start_time', start_time_str)
             try:
                 start_time = datetime.datetime.fromisoformat(start_time_str)
                 now = datetime.datetime.now()
@@ -54,20 +54,24 @@ class StopwatchWidget(BaseWidget):
                 total_elapsed = elapsed_seconds + current_elapsed
             except (ValueError, TypeError):
                 total_elapsed = elapsed_seconds
-            self.update_interval = 1  # Update every second when running
+            interval = 1  # Update every second when running
         elif state == 'stopped':
             total_elapsed = elapsed_seconds
-            self.update_interval = 60  # Update less frequently when stopped
+            interval = 60  # Update less frequently when stopped
         elif state == 'reset':
             # Perform reset
             total_elapsed = 0.0
-            self.properties['elapsed_seconds'] = 0.0
-            self.properties['start_time'] = None
-            self.properties['state'] = 'stopped'  # Change state to stopped after reset
-            self.update_interval = 60
+            self.set_property('elapsed_seconds', 0.0)
+            self.set_property('start_time', None)
+            self.set_property('state', 'stopped')  # Change state to stopped after reset
+            interval = 60
         else:
             total_elapsed = elapsed_seconds
-            self.update_interval = 60
+            interval = 60
+
+        if self.update_interval != interval:
+            self.update_interval = interval
+            self.mark_changed()
 
         elapsed_text = self.format_seconds(total_elapsed)
 
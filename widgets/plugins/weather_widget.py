@@ -12,6 +12,8 @@ from widgets.plugin_system import WidgetPlugin, WidgetMetadata
 class WeatherWidget(BaseWidget):
     """Widget for displaying current weather"""
 
+    REQUIRES_WEATHER_SERVICE = True
+
     def __init__(self, x: int = 0, y: int = 0, width: Optional[int] = None, height: Optional[int] = None, screen_size: int = 64):
         """
         Initialize weather widget